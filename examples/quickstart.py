@@ -18,24 +18,27 @@ from wagent.client import WagentClient
 
 def main() -> None:
     """メイン処理"""
-    # クライアントを作成
-    client = WagentClient()
+    with WagentClient() as client:
+        run(client)
 
+
+def run(client: WagentClient) -> None:
+    """クライアントを使ってサンプルを実行"""
     print("=" * 60)
     print("Wagent Quick Start Example")
     print("=" * 60)
 
     # サーバー接続を待機
     print("\n🔌 Connecting to Wagent server...")
-    if not client.wait_for_server(max_retries=10):
+    status = client.wait_for_server(max_retries=10)
+    if status is None:
         print("❌ Error: Could not connect to Wagent server.")
         print("   Make sure the server is running:")
         print("   $ rye run wagent --server")
         return
 
-    # ステータスを確認
+    # ステータスを確認（待機時に取得済み）
     print("\n📊 Checking status...")
-    status = client.status()
     print(f"   Browser Status: {status.browser_status}")
     print(f"   Logged In: {status.logged_in}")
     print(f"   Headless Mode: {status.headless}")
@@ -16,7 +16,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Optional
 
-from wagent.client import WagentClient
+from wagent.client import ChatResult, WagentClient
 
 # =============================================================================
 # 基底エージェントクラス
@@ -64,19 +64,24 @@ class ResearchAgent(BaseAgent):
     """
     リサーチエージェント
 
-    複数の質問を順番にChatGPTに投げて結果をまとめる。
+    複数の質問をChatGPTに投げて結果をまとめる。
+    デフォルトでは全質問を1回のリクエストにまとめて送信する。
     """
 
     def __init__(
         self,
         questions: list[str],
         delay_between: float = 3.0,
+        batch: bool = True,
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
         self.questions = questions
         self.delay_between = delay_between
+        self.batch = batch
         self.results: list[ResearchResult] = []
+        self.success_count = 0
+        self.total_elapsed = 0.0
 
     def run(self) -> None:
         """リサーチを実行"""
@@ -92,29 +97,53 @@ class ResearchAgent(BaseAgent):
         # 新しい会話を開始
         self.client.reset_session()
 
+        if self.batch:
+            self._run_batch()
+        else:
+            self._run_sequential()
+
+        self._print_summary()
+
+    def _run_batch(self) -> None:
+        """全質問を1回のリクエストで送信"""
+        self.log(f"📝 Sending {len(self.questions)} questions in one batch...")
+
+        results = self.client.chat_batch(self.questions)
+        if results:
+            self.total_elapsed += results[0].elapsed_seconds
+
+        for question, result in zip(self.questions, results):
+            self._record(question, result)
+
+    def _run_sequential(self) -> None:
+        """質問を1つずつ送信"""
         for i, question in enumerate(self.questions, 1):
             self.log(f"📝 [{i}/{len(self.questions)}] {question[:50]}...")
 
             result = self.client.chat(question)
+            self.total_elapsed += result.elapsed_seconds
+            self._record(question, result)
 
-            research_result = ResearchResult(
+            # レートリミット対策（サーバーが示す待機時間のみ待つ。上限は delay_between）
+            if i < len(self.questions):
+                time.sleep(min(result.retry_after or 0.0, self.delay_between))
+
+    def _record(self, question: str, result: ChatResult) -> None:
+        """結果を記録"""
+        self.results.append(
+            ResearchResult(
                 question=question,
                 answer=result.message if result.success else None,
                 success=result.success,
                 elapsed_seconds=result.elapsed_seconds,
             )
-            self.results.append(research_result)
-
-            if result.success:
-                self.log(f"   ✅ Got response ({result.response_length} chars)")
-            else:
-                self.log(f"   ❌ Error: {result.error}")
-
-            # レートリミット対策
-            if i < len(self.questions):
-                time.sleep(self.delay_between)
+        )
 
-        self._print_summary()
+        if result.success:
+            self.success_count += 1
+            self.log(f"   ✅ Got response ({result.response_length} chars)")
+        else:
+            self.log(f"   ❌ Error: {result.error}")
 
     def _print_summary(self) -> None:
         """サマリーを表示"""
@@ -123,11 +152,8 @@ class ResearchAgent(BaseAgent):
         self.log("📊 Research Summary")
         self.log("=" * 60)
 
-        success_count = sum(1 for r in self.results if r.success)
-        total_time = sum(r.elapsed_seconds for r in self.results)
-
-        self.log(f"   Success: {success_count}/{len(self.results)}")
-        self.log(f"   Total Time: {total_time:.1f}s")
+        self.log(f"   Success: {self.success_count}/{len(self.results)}")
+        self.log(f"   Total Time: {self.total_elapsed:.1f}s")
         self.log("")
 
         for i, result in enumerate(self.results, 1):
@@ -164,7 +190,8 @@ class CodeReviewAgent(BaseAgent):
     コードを投げてレビューコメントをもらう。
     """
 
-    REVIEW_PROMPT_TEMPLATE = """
+    # 固定部分を先頭に置き、可変部分（コード）は末尾に連結する
+    REVIEW_PROMPT_PREFIX = """
 以下のコードをレビューしてください。
 
 レビュー観点:
@@ -173,13 +200,11 @@ class CodeReviewAgent(BaseAgent):
 3. 可読性・保守性
 4. ベストプラクティスへの準拠
 
-コード:
-```{language}
-{code}
-```
-
 問題点と改善案を箇条書きで簡潔に述べてください。
+
+コード:
 """
+    REVIEW_PROMPT_SUFFIX = "```{language}\n{code}\n```\n"
 
     def __init__(
         self,
@@ -201,10 +226,7 @@ class CodeReviewAgent(BaseAgent):
             self.log("❌ Server not available")
             return
 
-        prompt = self.REVIEW_PROMPT_TEMPLATE.format(
-            language=self.language,
-            code=self.code,
-        )
+        prompt = self.build_prompt(self.language, self.code)
 
         result = self.client.chat(prompt, new_conversation=True)
 
@@ -222,6 +244,14 @@ class CodeReviewAgent(BaseAgent):
         else:
             self.log(f"❌ Error: {result.error}")
 
+    @classmethod
+    def build_prompt(cls, language: str, code: str) -> str:
+        """レビュー用プロンプトを生成"""
+        return cls.REVIEW_PROMPT_PREFIX + cls.REVIEW_PROMPT_SUFFIX.format(
+            language=language,
+            code=code,
+        )
+
 
 # =============================================================================
 # 翻訳エージェント
@@ -235,13 +265,13 @@ class TranslationAgent(BaseAgent):
     テキストを指定言語に翻訳する。
     """
 
-    TRANSLATE_PROMPT = """
-以下のテキストを{target_lang}に翻訳してください。
+    # 固定部分を先頭に置き、可変部分（翻訳先・テキスト）は末尾に連結する
+    TRANSLATE_PROMPT_PREFIX = """
+以下のテキストを指定した言語に翻訳してください。
 翻訳のみを出力し、説明は不要です。
 
-テキスト:
-{text}
 """
+    TRANSLATE_PROMPT_SUFFIX = "翻訳先: {target_lang}\n\nテキスト:\n{text}\n"
 
     def __init__(
         self,
@@ -262,10 +292,7 @@ class TranslationAgent(BaseAgent):
             self.log("❌ Server not available")
             return
 
-        prompt = self.TRANSLATE_PROMPT.format(
-            target_lang=self.target_lang,
-            text=self.text,
-        )
+        prompt = self.build_prompt(self.target_lang, self.text)
 
         result = self.client.chat(prompt, new_conversation=True)
 
@@ -277,6 +304,14 @@ class TranslationAgent(BaseAgent):
         else:
             self.log(f"❌ Error: {result.error}")
 
+    @classmethod
+    def build_prompt(cls, target_lang: str, text: str) -> str:
+        """翻訳用プロンプトを生成"""
+        return cls.TRANSLATE_PROMPT_PREFIX + cls.TRANSLATE_PROMPT_SUFFIX.format(
+            target_lang=target_lang,
+            text=text,
+        )
+
 
 # =============================================================================
 # メイン
@@ -290,8 +325,8 @@ def demo_research_agent() -> None:
         "FastAPIの主な特徴を3つ挙げて",
         "Playwrightとは何か1文で説明して",
     ]
-    agent = ResearchAgent(questions=questions)
-    agent.run()
+    with WagentClient() as client:
+        ResearchAgent(questions=questions, client=client).run()
 
 
 def demo_code_review_agent() -> None:
@@ -309,8 +344,8 @@ def sort_list(items):
                 items[i], items[j] = items[j], items[i]
     return items
 """
-    agent = CodeReviewAgent(code=code, language="python")
-    agent.run()
+    with WagentClient() as client:
+        CodeReviewAgent(code=code, language="python", client=client).run()
 
 
 def demo_translation_agent() -> None:
@@ -319,8 +354,8 @@ def demo_translation_agent() -> None:
     Wagentは、Web版ChatGPTをAPIとして利用するためのブリッジツールです。
     Playwrightによるブラウザ自動化を使用して、外部プログラムからChatGPTを操作できます。
     """
-    agent = TranslationAgent(text=text, target_lang="English")
-    agent.run()
+    with WagentClient() as client:
+        TranslationAgent(text=text, target_lang="English", client=client).run()
 
 
 def main() -> None:
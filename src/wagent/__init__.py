@@ -1,2 +0,0 @@
-def hello() -> str:
-    return "Hello from wagent!"
@@ -13,14 +13,42 @@ __version__ = "0.1.0"
 __author__ = "nezumi0627"
 __license__ = "MIT"
 
-from wagent.browser import BrowserController
-from wagent.client import WagentClient
-from wagent.config import Config
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from wagent.browser import BrowserController
+    from wagent.cache import SemanticCache
+    from wagent.client import AsyncWagentClient, WagentClient
+    from wagent.config import Config
 
 __all__ = [
     "__version__",
     "__author__",
+    "AsyncWagentClient",
     "Config",
     "BrowserController",
+    "SemanticCache",
     "WagentClient",
 ]
+
+# 公開名 -> 定義モジュール（初回アクセス時にインポートし、CLI起動を軽くする）
+_LAZY_EXPORTS = {
+    "AsyncWagentClient": "wagent.client",
+    "BrowserController": "wagent.browser",
+    "Config": "wagent.config",
+    "SemanticCache": "wagent.cache",
+    "WagentClient": "wagent.client",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """公開クラスは初回アクセス時にインポート"""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -7,13 +7,17 @@ Browser Controller - Playwrightによるブラウザ自動操作
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import random
+import re
 from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, Optional
 
+import orjson
 from loguru import logger
 from playwright.async_api import (
     BrowserContext,
@@ -21,10 +25,9 @@ from playwright.async_api import (
     Playwright,
     async_playwright,
 )
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
-if TYPE_CHECKING:
-    from wagent.config import Config, Selectors
-
+from wagent.config import Config, Selectors
 
 # =============================================================================
 # ステルスモジュール
@@ -69,6 +72,61 @@ class PlaywrightStealthModule(StealthModule):
             logger.debug("Stealth mode applied via playwright-stealth")
 
 
+def _isolate_script(script: str) -> str:
+    """スクリプトをIIFEで包んでスコープを分離"""
+    return f"(() => {{{script}}})();"
+
+
+# 前後の空白を省略できる記号
+_JS_PUNCTUATION = frozenset("{}()[];,:=?")
+
+
+def _minify_js(source: str) -> str:
+    """
+    JavaScriptを簡易的に縮小
+
+    コメントを除去し、文字列リテラル外の空白を詰める。自動セミコロン挿入を
+    壊さないよう、改行は記号に隣接する場合を除いて1つ残す。
+    正規表現リテラルには対応しない。
+    """
+    out: list[str] = []
+    i, n = 0, len(source)
+
+    while i < n:
+        ch = source[i]
+
+        if ch in "'\"`":
+            # 文字列リテラルはそのまま
+            end = i + 1
+            while end < n and source[end] != ch:
+                end += 2 if source[end] == "\\" else 1
+            out.append(source[i : end + 1])
+            i = end + 1
+        elif source.startswith("//", i):
+            end = source.find("\n", i)
+            i = n if end == -1 else end
+        elif source.startswith("/*", i):
+            end = source.find("*/", i + 2)
+            i = n if end == -1 else end + 2
+        elif ch.isspace():
+            end = i
+            while end < n and source[end].isspace():
+                end += 1
+            prev = out[-1][-1] if out else ""
+            nxt = source[end] if end < n else ""
+            if "\n" in source[i:end]:
+                if prev and prev not in "{[(,;:=" and nxt not in "}])":
+                    out.append("\n")
+            elif prev not in _JS_PUNCTUATION and nxt not in _JS_PUNCTUATION:
+                out.append(" ")
+            i = end
+        else:
+            out.append(ch)
+            i += 1
+
+    return "".join(out).strip()
+
+
 class CustomStealthModule(StealthModule):
     """カスタムステルススクリプト"""
 
@@ -111,9 +169,11 @@ class CustomStealthModule(StealthModule):
         """,
     ]
 
+    # 全スクリプトを1つに連結・縮小（add_init_script は1回で済む）
+    STEALTH_SCRIPT: str = _minify_js("\n".join(map(_isolate_script, STEALTH_SCRIPTS)))
+
     async def apply(self, page: Page) -> None:
-        for script in self.STEALTH_SCRIPTS:
-            await page.add_init_script(script)
+        await page.add_init_script(self.STEALTH_SCRIPT)
         logger.debug("Custom stealth scripts applied")
 
 
@@ -121,6 +181,13 @@ class CustomStealthModule(StealthModule):
 # 人間らしい挙動シミュレーター
 # =============================================================================
 
+# 単語 + 後続の空白を1チャンクとする
+_WORD_CHUNK_PATTERN = re.compile(r"\S+\s*|\s+")
+
+# チャンク入力モードの1チャンクあたりの文字数
+_INSERT_CHUNK_MIN = 8
+_INSERT_CHUNK_MAX = 32
+
 
 @dataclass
 class HumanBehaviorSimulator:
@@ -133,31 +200,88 @@ class HumanBehaviorSimulator:
     word_pause_max: int = 300
     action_delay_min: int = 500
     action_delay_max: int = 1500
+    fast_mode: bool = False
+    insert_chunks: bool = False
+    # インスタンスごとの乱数生成器（並行実行時にグローバル状態を共有しない）
+    _rng: random.Random = field(default_factory=random.Random, init=False, repr=False)
 
     async def type_like_human(self, page: Page, selector: str, text: str) -> None:
-        """人間らしいタイピング速度でテキストを入力"""
+        """
+        人間らしいタイピング速度でテキストを入力
+
+        fast_mode が有効な場合はキー入力を行わず、fill で一括入力する。
+        insert_chunks が有効な場合は数十文字単位のチャンクで入力する。
+        """
         element = await page.wait_for_selector(selector, timeout=10000)
         if element is None:
             raise RuntimeError(f"Element not found: {selector}")
 
+        if self.fast_mode:
+            # fill は input イベントも発火する
+            await element.fill(text)
+            logger.debug(f"Filled {len(text)} characters (fast mode)")
+            return
+
         await element.click()
         await self.random_delay(100, 300)
 
-        for i, char in enumerate(text):
-            # 文字を入力
-            delay = random.randint(self.typing_min_delay, self.typing_max_delay)
-            await page.keyboard.type(char, delay=delay)
+        if self.insert_chunks:
+            await self._insert_in_chunks(page, text)
+            return
+
+        # 単語単位でまとめて入力（1チャンク = 1回のプロトコル呼び出し）
+        chunks = _WORD_CHUNK_PATTERN.findall(text)
 
-            # 単語区切りでランダムに休憩
-            if char == " " and random.random() < self.word_pause_probability:
-                pause = random.randint(self.word_pause_min, self.word_pause_max)
-                await asyncio.sleep(pause / 1000)
+        # 遅延と単語区切りの休憩はループ前にまとめて生成
+        delays = self._rng.choices(
+            range(self.typing_min_delay, self.typing_max_delay + 1),
+            k=len(chunks),
+        )
+        pauses = [
+            self._rng.randint(self.word_pause_min, self.word_pause_max) / 1000
+            if chunk.endswith(" ") and self._rng.random() < self.word_pause_probability
+            else 0.0
+            for chunk in chunks
+        ]
+
+        for chunk, delay, pause in zip(chunks, delays, pauses):
+            await page.keyboard.type(chunk, delay=delay)
+            if pause:
+                await asyncio.sleep(pause)
 
         logger.debug(f"Typed {len(text)} characters with human-like timing")
 
+    async def _insert_in_chunks(self, page: Page, text: str) -> None:
+        """
+        8〜32文字のチャンク単位で insert_text により入力
+
+        チャンクごとに「文字数 × 1文字あたりの遅延」をまとめて待機し、
+        入力速度の揺らぎを保ったままプロトコル呼び出しを減らす。
+        """
+        # チャンク分割と待機時間はループ前にまとめて生成
+        chunks: list[str] = []
+        pos = 0
+        while pos < len(text):
+            size = self._rng.randint(_INSERT_CHUNK_MIN, _INSERT_CHUNK_MAX)
+            chunks.append(text[pos : pos + size])
+            pos += size
+
+        sleeps = [
+            self._rng.uniform(self.typing_min_delay, self.typing_max_delay)
+            * len(chunk)
+            / 1000
+            for chunk in chunks
+        ]
+
+        for chunk, sleep in zip(chunks, sleeps):
+            await page.keyboard.insert_text(chunk)
+            await asyncio.sleep(sleep)
+
+        logger.debug(f"Inserted {len(text)} characters in chunks")
+
     async def random_delay(self, min_ms: int, max_ms: int) -> None:
         """ランダムな遅延を追加"""
-        delay = random.randint(min_ms, max_ms) / 1000
+        delay = self._rng.randint(min_ms, max_ms) / 1000
         await asyncio.sleep(delay)
 
     async def action_delay(self) -> None:
@@ -170,6 +294,48 @@ class HumanBehaviorSimulator:
 # =============================================================================
 
 
+# バックグラウンド処理を止めて起動・ナビゲーションを軽くするフラグ
+_PERF_ARGS = (
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-breakpad",
+    "--disable-component-extensions-with-background-pages",
+    "--disable-features=TranslateUI",
+    "--disable-ipc-flooding-protection",
+    "--disable-renderer-backgrounding",
+    "--metrics-recording-only",
+    "--no-first-run",
+)
+
+# ナビゲーション後、入力エリアの表示を待つ時間（ミリ秒）
+_INPUT_READY_TIMEOUT = 15000
+
+# evaluate_script(as_json=True) で受け取る結果の上限（文字数）
+_EVALUATE_JSON_MAX_CHARS = 8 * 1024 * 1024
+
+# 結果をページ内で JSON 文字列化し、サイズを確認してから返す
+_EVALUATE_JSON_TEMPLATE = """
+async () => {{
+    const value = ({script});
+    const result = await (typeof value === "function" ? value() : value);
+    const json = JSON.stringify(result);
+    if (json !== undefined && json.length > {max_chars}) {{
+        throw new Error(`Result too large: ${{json.length}} chars (max {max_chars})`);
+    }}
+    return json === undefined ? null : json;
+}}
+"""
+
+# 生成完了後、レスポンス本文の要素を待つ時間（ミリ秒）
+_RESPONSE_EXTRACT_TIMEOUT = 5000
+
+
+def _join_selectors(*selectors: Optional[str]) -> str:
+    """代替セレクタをカンマで連結（1回の検索でいずれかに一致させる）"""
+    return ", ".join(s for s in selectors if s)
+
+
 class BrowserController:
     """
     Playwrightベースのブラウザコントローラー
@@ -181,6 +347,11 @@ class BrowserController:
             await browser.navigate_to_chatgpt()
             await browser.send_prompt("Hello!")
             response = await browser.wait_for_response()
+
+        # 長時間使い回す場合
+        browser = await BrowserController.start()
+        ...
+        await browser.close()
     """
 
     def __init__(
@@ -201,26 +372,61 @@ class BrowserController:
         self._stealth = stealth
         self._human = human
         self._is_closed = False
+        self._last_screenshot_hash: Optional[bytes] = None
+        self._last_screenshot_path: Optional[str] = None
+
+        # セレクタ・タイミング値を一度だけ解決してキャッシュ
+        self._base_url: str = selectors.get("chatgpt.base_url", "https://chatgpt.com")
+        self._sel_textarea: str = selectors.get(
+            "chatgpt.input.textarea", "#prompt-textarea"
+        )
+        self._sel_textarea_alt: str = selectors.get("chatgpt.input.textarea_alt")
+        self._sel_textarea_any = _join_selectors(
+            self._sel_textarea, self._sel_textarea_alt
+        )
+        self._sel_send_button: str = selectors.get("chatgpt.input.send_button")
+        self._sel_send_button_alt: str = selectors.get("chatgpt.input.send_button_alt")
+        self._sel_send_button_any = _join_selectors(
+            self._sel_send_button, self._sel_send_button_alt
+        )
+        self._sel_generating: str = selectors.get("chatgpt.status.generating")
+        self._sel_message_container: str = selectors.get(
+            "chatgpt.output.message_container", ""
+        )
+        self._sel_message_content: str = selectors.get(
+            "chatgpt.output.message_content", ".markdown"
+        )
+        self._sel_new_chat = _join_selectors(
+            selectors.get("chatgpt.navigation.new_chat"),
+            selectors.get("chatgpt.navigation.new_chat_alt"),
+        )
+        self._sel_logged_in: str = selectors.get("chatgpt.auth.logged_in_indicator")
+        self._response_timeout = int(
+            selectors.get("chatgpt.timing.response_timeout", "120000")
+        )
+        self._poll_interval = (
+            int(selectors.get("chatgpt.timing.response_poll_interval", "500")) / 1000
+        )
 
     @classmethod
-    @asynccontextmanager
-    async def create(
+    async def start(
         cls,
         config: Optional[Config] = None,
         selectors: Optional[Selectors] = None,
-    ) -> AsyncGenerator[BrowserController, None]:
+    ) -> BrowserController:
         """
-        ブラウザコントローラーを作成するファクトリメソッド
+        ブラウザを起動してコントローラーを返す
+
+        複数のリクエストにまたがって使い回す場合に使用する。
+        不要になったら close() を呼び出すこと。
 
         Args:
             config: 設定オブジェクト（省略時は自動読み込み）
             selectors: セレクタオブジェクト（省略時は自動読み込み）
 
-        Yields:
+        Returns:
             BrowserController インスタンス
         """
-        from wagent.config import Config, Selectors
-
         # 設定を読み込み
         if config is None:
             config = Config.load()
@@ -230,6 +436,7 @@ class BrowserController:
         logger.info("Initializing browser controller...")
 
         playwright = await async_playwright().start()
+        context: Optional[BrowserContext] = None
 
         try:
             # ブラウザ設定を構築
@@ -246,6 +453,15 @@ class BrowserController:
             if config.stealth.hide_webdriver:
                 browser_args.append("--disable-automation")
 
+            if config.browser.perf_flags:
+                browser_args.extend(_PERF_ARGS)
+
+            if config.browser.slow_mo > 0:
+                logger.warning(
+                    f"slow_mo={config.browser.slow_mo}ms is active; "
+                    "every browser operation will be delayed"
+                )
+
             # ユーザーエージェント
             user_agent = config.get_user_agent()
             logger.debug(f"Using User-Agent: {user_agent[:50]}...")
@@ -266,6 +482,11 @@ class BrowserController:
                 ignore_default_args=["--enable-automation"],
             )
 
+            # 保存済みセッション（Cookie）を復元
+            state_path = config.session.storage_state_path
+            if state_path and Path(state_path).exists():
+                await cls._restore_storage_state(context, state_path)
+
             # ページを取得または作成
             page = context.pages[0] if context.pages else await context.new_page()
 
@@ -291,25 +512,86 @@ class BrowserController:
                 word_pause_max=hb.typing.word_pause_max,
                 action_delay_min=hb.action_delay.min,
                 action_delay_max=hb.action_delay.max,
+                fast_mode=hb.typing.fast_mode,
+                insert_chunks=hb.typing.insert_chunks,
             )
 
-            controller = cls(
-                config=config,
-                selectors=selectors,
-                playwright=playwright,
-                context=context,
-                page=page,
-                stealth=stealth,
-                human=human,
+        except BaseException:
+            # 起動途中で失敗した場合は確保済みのリソースを解放
+            if context is not None:
+                await context.close()
+            await playwright.stop()
+            raise
+
+        controller = cls(
+            config=config,
+            selectors=selectors,
+            playwright=playwright,
+            context=context,
+            page=page,
+            stealth=stealth,
+            human=human,
+        )
+
+        logger.info("Browser controller initialized")
+        return controller
+
+    async def close(self) -> None:
+        """セッションを保存してブラウザを終了（複数回呼び出しても安全）"""
+        if self._is_closed:
+            return
+        self._is_closed = True
+
+        logger.info("Closing browser controller...")
+        if self._config.session.storage_state_path:
+            await self._save_storage_state(
+                self._context, self._config.session.storage_state_path
             )
+        await self._context.close()
+        await self._playwright.stop()
 
-            logger.info("Browser controller initialized")
-            yield controller
+    @classmethod
+    @asynccontextmanager
+    async def create(
+        cls,
+        config: Optional[Config] = None,
+        selectors: Optional[Selectors] = None,
+    ) -> AsyncGenerator[BrowserController, None]:
+        """
+        ブラウザコントローラーを作成するファクトリメソッド
 
+        Args:
+            config: 設定オブジェクト（省略時は自動読み込み）
+            selectors: セレクタオブジェクト（省略時は自動読み込み）
+
+        Yields:
+            BrowserController インスタンス
+        """
+        controller = await cls.start(config, selectors)
+        try:
+            yield controller
         finally:
-            logger.info("Closing browser controller...")
-            await context.close()
-            await playwright.stop()
+            await controller.close()
+
+    @staticmethod
+    async def _restore_storage_state(context: BrowserContext, path: str) -> None:
+        """保存済みセッションのCookieを復元（失敗時は復元せずに続行）"""
+        try:
+            state = json.loads(Path(path).read_text(encoding="utf-8"))
+            await context.add_cookies(state.get("cookies", []))
+            logger.info(f"Session restored from {path}")
+        except Exception as e:
+            logger.warning(f"Failed to restore session: {e}")
+
+    @staticmethod
+    async def _save_storage_state(context: BrowserContext, path: str) -> None:
+        """セッション（Cookie・localStorage）をファイルに保存"""
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            await context.storage_state(path=path)
+            logger.info(f"Session saved to {path}")
+        except Exception as e:
+            logger.warning(f"Failed to save session: {e}")
 
     # =========================================================================
     # プロパティ
@@ -331,22 +613,37 @@ class BrowserController:
 
     async def navigate_to_chatgpt(self) -> None:
         """ChatGPTのページに移動"""
-        base_url = self._selectors.get("chatgpt.base_url", "https://chatgpt.com")
-        logger.info(f"Navigating to {base_url}")
+        logger.info(f"Navigating to {self._base_url}")
+        self._reset_screenshot_cache()
 
         await self._page.goto(
-            base_url,
+            self._base_url,
             wait_until=self._config.browser.wait_until,  # type: ignore
             timeout=self._config.browser.timeout,
         )
+        await self._wait_for_input()
         await self._human.action_delay()
 
+    async def _wait_for_input(self) -> None:
+        """
+        入力エリアが表示されるまで待機
+
+        networkidle（解析用の通信が止むまで待つ）の代わりに、操作に必要な
+        要素の表示をもってページの準備完了とみなす。未ログイン時は入力エリアが
+        表示されないため、タイムアウトしても警告のみとする。
+        """
+        try:
+            await self._page.locator(self._sel_textarea_any).first.wait_for(
+                state="visible", timeout=_INPUT_READY_TIMEOUT
+            )
+        except PlaywrightTimeoutError:
+            logger.warning("Input textarea did not appear")
+
     async def is_logged_in(self) -> bool:
         """ログイン状態を確認"""
         try:
-            indicator = self._selectors.get("chatgpt.auth.logged_in_indicator")
-            if indicator:
-                element = await self._page.query_selector(indicator)
+            if self._sel_logged_in:
+                element = await self._page.query_selector(self._sel_logged_in)
                 return element is not None
         except Exception as e:
             logger.error(f"Error checking login status: {e}")
@@ -365,31 +662,19 @@ class BrowserController:
         """
         logger.info(f"Sending prompt ({len(prompt)} chars)...")
 
-        # 入力エリアのセレクタを取得
-        textarea = self._selectors.get("chatgpt.input.textarea", "#prompt-textarea")
-        textarea_alt = self._selectors.get("chatgpt.input.textarea_alt")
-
-        # 入力エリアを検索
-        element = await self._page.query_selector(textarea)
-        if element is None and textarea_alt:
-            element = await self._page.query_selector(textarea_alt)
-
-        if element is None:
-            raise RuntimeError("Could not find input textarea")
-
-        # プロンプトを入力
-        await self._human.type_like_human(self._page, textarea, prompt)
+        # プロンプトを入力（代替セレクタを連結し、入力エリアの検索は
+        # type_like_human の wait_for_selector 1回で済ませる）
+        try:
+            await self._human.type_like_human(
+                self._page, self._sel_textarea_any, prompt
+            )
+        except PlaywrightTimeoutError as e:
+            raise RuntimeError("Could not find input textarea") from e
         await self._human.random_delay(300, 600)
 
-        # 送信ボタンをクリック
-        send_button = self._selectors.get("chatgpt.input.send_button")
-        send_button_alt = self._selectors.get("chatgpt.input.send_button_alt")
-
-        button = await self._page.query_selector(send_button)
-        if button is None and send_button_alt:
-            button = await self._page.query_selector(send_button_alt)
-
-        if button:
+        # 送信ボタンをクリック（ボタンは入力後に表示されるため入力後に検索）
+        button = self._page.locator(self._sel_send_button_any).first
+        if await button.count():
             await button.click()
         else:
             # Enterキーで送信
@@ -408,56 +693,36 @@ class BrowserController:
             レスポンステキスト
         """
         if timeout_ms is None:
-            timeout_ms = int(
-                self._selectors.get("chatgpt.timing.response_timeout", "120000")
-            )
-
-        poll_interval = int(
-            self._selectors.get("chatgpt.timing.response_poll_interval", "500")
-        )
-        generating_selector = self._selectors.get("chatgpt.status.generating")
+            timeout_ms = self._response_timeout
 
         logger.info("Waiting for response...")
 
         # 生成開始を待機
-        await asyncio.sleep(poll_interval / 1000)
-
-        # 生成完了を待機（ポーリング）
-        elapsed = 0
-        while elapsed < timeout_ms:
-            generating = await self._page.query_selector(generating_selector)
+        await asyncio.sleep(self._poll_interval)
 
-            if generating is None:
-                await asyncio.sleep(0.5)  # DOM安定待ち
-                break
-
-            await asyncio.sleep(poll_interval / 1000)
-            elapsed += poll_interval
+        # 生成完了を待機（ページ内で要素の消滅を監視し、ポーリングしない）
+        try:
+            await self._page.locator(self._sel_generating).first.wait_for(
+                state="detached", timeout=timeout_ms
+            )
+        except PlaywrightTimeoutError as e:
+            raise TimeoutError("Response timeout exceeded") from e
 
-        if elapsed >= timeout_ms:
-            raise TimeoutError("Response timeout exceeded")
+        await asyncio.sleep(0.5)  # DOM安定待ち
 
-        # レスポンスを取得
-        response_elements = await self._page.query_selector_all(
-            self._selectors.get("chatgpt.output.message_container", "")
+        # 最後のレスポンスのみを取得（全メッセージを転送しない）
+        content = (
+            self._page.locator(self._sel_message_container)
+            .last.locator(self._sel_message_content)
+            .first
         )
+        try:
+            text = await content.inner_text(timeout=_RESPONSE_EXTRACT_TIMEOUT)
+        except PlaywrightTimeoutError as e:
+            raise RuntimeError("Could not extract response text") from e
 
-        if not response_elements:
-            raise RuntimeError("No response found")
-
-        # 最後のレスポンスを取得
-        last_response = response_elements[-1]
-        content_selector = self._selectors.get(
-            "chatgpt.output.message_content", ".markdown"
-        )
-        content_element = await last_response.query_selector(content_selector)
-
-        if content_element:
-            text = await content_element.inner_text()
-            logger.info(f"Response received ({len(text)} chars)")
-            return text
-
-        raise RuntimeError("Could not extract response text")
+        logger.info(f"Response received ({len(text)} chars)")
+        return text
 
     # =========================================================================
     # セッション管理
@@ -465,12 +730,10 @@ class BrowserController:
 
     async def new_chat(self) -> None:
         """新しいチャットを開始"""
-        selector = self._selectors.get("chatgpt.navigation.new_chat")
-        alt_selector = self._selectors.get("chatgpt.navigation.new_chat_alt")
-
-        element = await self._page.query_selector(selector)
-        if element is None and alt_selector:
-            element = await self._page.query_selector(alt_selector)
+        self._reset_screenshot_cache()
+        element = None
+        if self._sel_new_chat:
+            element = await self._page.query_selector(self._sel_new_chat)
 
         if element:
             await element.click()
@@ -478,8 +741,12 @@ class BrowserController:
             logger.info("Started new chat")
         else:
             # URLで直接移動
-            base_url = self._selectors.get("chatgpt.base_url", "https://chatgpt.com")
-            await self._page.goto(base_url, wait_until="networkidle")
+            await self._page.goto(
+                self._base_url,
+                wait_until="domcontentloaded",
+                timeout=self._config.browser.timeout,
+            )
+            await self._wait_for_input()
 
     # =========================================================================
     # ユーティリティ
@@ -497,19 +764,60 @@ class BrowserController:
         """
         import time
 
-        if path is None:
-            screenshots_dir = Path("screenshots")
-            screenshots_dir.mkdir(exist_ok=True)
-            path = str(screenshots_dir / f"screenshot_{int(time.time())}.png")
-
-        await self._page.screenshot(path=path)
+        # 明示パスは拡張子に応じた形式で Playwright に直接保存させる
+        if path is not None:
+            await self._page.screenshot(path=path)
+            logger.info(f"Screenshot saved: {path}")
+            return path
+
+        data = await self._page.screenshot()
+        digest = hashlib.sha256(data).digest()
+
+        # 前回と同一の画面なら保存を省略
+        if (
+            digest == self._last_screenshot_hash
+            and self._last_screenshot_path is not None
+        ):
+            logger.debug("Screenshot unchanged, reusing previous file")
+            return self._last_screenshot_path
+
+        screenshots_dir = Path("screenshots")
+        screenshots_dir.mkdir(parents=True, exist_ok=True)
+        path = str(screenshots_dir / f"screenshot_{int(time.time())}.png")
+
+        await asyncio.to_thread(Path(path).write_bytes, data)
+        self._last_screenshot_hash = digest
+        self._last_screenshot_path = path
         logger.info(f"Screenshot saved: {path}")
         return path
 
+    def _reset_screenshot_cache(self) -> None:
+        """画面遷移時にスクリーンショットの重複判定をリセット"""
+        self._last_screenshot_hash = None
+        self._last_screenshot_path = None
+
     async def get_page_content(self) -> str:
         """ページのHTMLコンテンツを取得"""
         return await self._page.content()
 
-    async def evaluate_script(self, script: str) -> any:
-        """JavaScriptを実行"""
-        return await self._page.evaluate(script)
+    async def evaluate_script(self, script: str, *, as_json: bool = False) -> Any:
+        """
+        JavaScriptを実行
+
+        Args:
+            script: JavaScriptの式または関数
+            as_json: ページ内で JSON.stringify した文字列として受け取る
+                （DOMノード等の巨大なオブジェクトの転送を防ぎ、
+                _EVALUATE_JSON_MAX_CHARS を超える結果はエラーにする）
+
+        Returns:
+            実行結果
+        """
+        if not as_json:
+            return await self._page.evaluate(script)
+
+        wrapped = _EVALUATE_JSON_TEMPLATE.format(
+            script=script, max_chars=_EVALUATE_JSON_MAX_CHARS
+        )
+        result = await self._page.evaluate(wrapped)
+        return orjson.loads(result) if result is not None else None
@@ -0,0 +1,190 @@
+"""
+Cache - レスポンスキャッシュ
+
+同一（または意味的に近い）プロンプトに対するChatGPTの回答をローカルに保持し、
+ブラウザ往復を省略する。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Sequence
+
+# 埋め込み関数: テキスト -> ベクトル
+Embedder = Callable[[str], Sequence[float]]
+
+# set() 待ちとして保持するベクトルの最大数（並行リクエスト数の目安）
+_PENDING_VECTORS_MAX = 16
+
+
+# =============================================================================
+# キャッシュエントリ
+# =============================================================================
+
+
+@dataclass
+class CacheEntry:
+    """キャッシュエントリ"""
+
+    value: Any
+    expires_at: float
+    vector: Optional[tuple[float, ...]] = None
+
+
+# =============================================================================
+# セマンティックキャッシュ
+# =============================================================================
+
+
+class SemanticCache:
+    """
+    プロンプトをキーとするレスポンスキャッシュ
+
+    正規化したプロンプトのSHA-256で完全一致を検索し、ミス時は埋め込み関数
+    （指定時のみ）によるコサイン類似度で近傍のエントリを検索する。
+
+    Usage:
+        cache = SemanticCache(ttl=3600)
+        client = WagentClient(cache=cache)
+
+        # sentence-transformers 等の埋め込みを使う場合
+        model = SentenceTransformer("all-MiniLM-L6-v2")
+        cache = SemanticCache(embedder=model.encode, threshold=0.92)
+    """
+
+    def __init__(
+        self,
+        embedder: Optional[Embedder] = None,
+        threshold: float = 0.92,
+        ttl: float = 3600,
+        max_entries: int = 256,
+    ) -> None:
+        """
+        Args:
+            embedder: 埋め込み関数（省略時は完全一致のみ）
+            threshold: 類似ヒットとみなすコサイン類似度の閾値
+            ttl: エントリの有効期間（秒）
+            max_entries: 保持する最大エントリ数（超過時は古いものから削除）
+        """
+        self.embedder = embedder
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        # chat_parallel などで複数スレッドから使われるため操作全体を保護
+        self._lock = threading.Lock()
+        # get() ミス時に計算したベクトル。続く set() で再利用する
+        self._pending_vectors: OrderedDict[str, tuple[float, ...]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, prompt: str) -> Optional[Any]:
+        """
+        プロンプトに対応するキャッシュ値を取得
+
+        Args:
+            prompt: プロンプト
+
+        Returns:
+            キャッシュされた値、ミス時はNone
+        """
+        key = self._key(prompt)
+        with self._lock:
+            self._evict_expired()
+
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry.value
+
+            if self.embedder is None or not self._entries:
+                return None
+
+        # 埋め込みは時間がかかるため、ロックの外で計算する
+        vector = self._embed(prompt)
+
+        with self._lock:
+            self._remember_vector(key, vector)
+            best_key, best_score = None, self.threshold
+            for candidate_key, candidate in self._entries.items():
+                if candidate.vector is None:
+                    continue
+                score = sum(a * b for a, b in zip(vector, candidate.vector))
+                if score >= best_score:
+                    best_key, best_score = candidate_key, score
+
+            if best_key is None:
+                return None
+
+            self._entries.move_to_end(best_key)
+            return self._entries[best_key].value
+
+    def set(self, prompt: str, value: Any) -> None:
+        """
+        プロンプトに対する値を保存
+
+        Args:
+            prompt: プロンプト
+            value: 保存する値
+        """
+        key = self._key(prompt)
+        vector = None
+        if self.embedder is not None:
+            with self._lock:
+                vector = self._pending_vectors.pop(key, None)
+            if vector is None:
+                vector = self._embed(prompt)
+
+        with self._lock:
+            self._entries[key] = CacheEntry(
+                value=value,
+                expires_at=time.monotonic() + self.ttl,
+                vector=vector,
+            )
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """全エントリを削除"""
+        with self._lock:
+            self._entries.clear()
+            self._pending_vectors.clear()
+
+    # =========================================================================
+    # 内部メソッド
+    # =========================================================================
+
+    @staticmethod
+    def _key(prompt: str) -> str:
+        """正規化したプロンプトのハッシュキー"""
+        canonical = "\n".join(line.rstrip() for line in prompt.strip().splitlines())
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _embed(self, prompt: str) -> tuple[float, ...]:
+        """埋め込みベクトルを計算して正規化"""
+        assert self.embedder is not None
+        vector = [float(x) for x in self.embedder(prompt)]
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        return tuple(x / norm for x in vector)
+
+    def _remember_vector(self, key: str, vector: tuple[float, ...]) -> None:
+        """get() ミス時のベクトルを続く set() 用に保持（ロック取得済みで呼ぶ）"""
+        self._pending_vectors[key] = vector
+        self._pending_vectors.move_to_end(key)
+        while len(self._pending_vectors) > _PENDING_VECTORS_MAX:
+            self._pending_vectors.popitem(last=False)
+
+    def _evict_expired(self) -> None:
+        """期限切れのエントリを削除"""
+        now = time.monotonic()
+        expired = [k for k, e in self._entries.items() if e.expires_at <= now]
+        for key in expired:
+            del self._entries[key]
@@ -6,12 +6,56 @@ Client - Wagent APIクライアント
 
 from __future__ import annotations
 
+import asyncio
+import random
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Optional
 
+import orjson
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+if TYPE_CHECKING:
+    from wagent.cache import SemanticCache
+
+# バッチ回答の見出し（"### A1" または Markdown 描画後の "A1"）
+_ANSWER_HEADER_PATTERN = re.compile(
+    r"^(?:#{1,6}[ \t]*)?A(\d+)[ \t]*[:：]?[ \t]*$",
+    re.MULTILINE,
+)
+
+# 冪等なリクエストのみ、ゲートウェイエラー（起動直後のリバースプロキシ等）を
+# アダプター側で短い間隔で再試行する。接続エラーと 429 は _request() で扱う
+_GATEWAY_RETRY = Retry(
+    total=2,
+    connect=0,
+    read=0,
+    status=2,
+    backoff_factor=0.1,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({"GET", "HEAD", "DELETE"}),
+    respect_retry_after_header=False,
+    raise_on_status=False,
+)
+
+# JSONボディ送信時のヘッダー（リクエストごとに生成しない）
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# この長さ（バイト）を超えるレスポンスはチャンク単位で読み込む
+_STREAM_THRESHOLD = 32 * 1024
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+_BATCH_INSTRUCTION = (
+    "以下の{count}個の質問にそれぞれ回答してください。\n"
+    "各回答は対応する番号の見出し（### A1, ### A2, ...）の下に、"
+    "見出しの行には番号以外を書かずに記述してください。"
+)
 
 # =============================================================================
 # 例外クラス
@@ -39,7 +83,9 @@ class TimeoutError(WagentClientError):
 class RateLimitError(WagentClientError):
     """レートリミットエラー"""
 
-    pass
+    def __init__(self, message: str, retry_after: Optional[float] = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 # =============================================================================
@@ -57,6 +103,7 @@ class ChatResult:
     elapsed_seconds: float
     prompt_length: Optional[int] = None
     response_length: Optional[int] = None
+    retry_after: Optional[float] = None
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ChatResult:
@@ -68,6 +115,7 @@ class ChatResult:
             elapsed_seconds=data.get("elapsed_seconds", 0.0),
             prompt_length=data.get("prompt_length"),
             response_length=data.get("response_length"),
+            retry_after=data.get("retry_after"),
         )
 
 
@@ -104,6 +152,9 @@ class WagentClient:
 
     Wagentサーバーとの通信を行うクライアントライブラリ。
 
+    1つの requests.Session を使い回すため、同一クライアントからの
+    連続リクエストはKeep-Alive接続を再利用する。
+
     Usage:
         client = WagentClient()
 
@@ -122,6 +173,16 @@ class WagentClient:
 
     DEFAULT_BASE_URL = "http://127.0.0.1:8765"
     DEFAULT_TIMEOUT = 180
+    # status() の結果を再利用する期間（秒）
+    STATUS_TTL = 1.0
+    # health() のタイムアウト（接続, 読み込み）
+    HEALTH_TIMEOUT = (1.0, 2.0)
+    # wait_for_server の最初の再接続間隔（秒）
+    RECONNECT_INITIAL_DELAY = 0.05
+    # 接続先ホストごとのプール数と、1プールあたりの接続数
+    # （chat_parallel の同時実行数を上回るように）
+    POOL_CONNECTIONS = 4
+    POOL_SIZE = 32
 
     def __init__(
         self,
@@ -129,6 +190,8 @@ class WagentClient:
         timeout: int = DEFAULT_TIMEOUT,
         auto_retry: bool = True,
         max_retries: int = 3,
+        cache: Optional[SemanticCache] = None,
+        session: Optional[requests.Session] = None,
     ) -> None:
         """
         Args:
@@ -136,12 +199,41 @@ class WagentClient:
             timeout: リクエストタイムアウト（秒）
             auto_retry: 失敗時に自動リトライするか
             max_retries: 最大リトライ回数
+            cache: レスポンスキャッシュ（new_conversation=True の場合のみ使用）
+            session: 共有するセッション（省略時は専用のセッションを作成）。
+                渡されたセッションは close() で閉じない
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.auto_retry = auto_retry
         self.max_retries = max_retries
-        self._session = requests.Session()
+        self.cache = cache
+        self._owns_session = session is None
+        self._session = session if session is not None else self.create_session()
+        # /ready は未準備時に 504 を返すため、ゲートウェイ再試行の対象から外す
+        # （待機期限の管理は wait_for_server の再接続ループに一本化する）
+        self._session.mount(f"{self.base_url}/ready", HTTPAdapter(max_retries=0))
+        self._last_status: Optional[StatusResult] = None
+        self._last_status_time = 0.0
+        self._health_verb = "HEAD"
+
+    @classmethod
+    def create_session(cls) -> requests.Session:
+        """
+        コネクションプールを設定したセッションを作成
+
+        複数のクライアントで接続を共有する場合は、このセッションを
+        各クライアントの session 引数に渡す。
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=cls.POOL_CONNECTIONS,
+            pool_maxsize=cls.POOL_SIZE,
+            max_retries=_GATEWAY_RETRY,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
     # =========================================================================
     # パブリックAPI
@@ -163,7 +255,18 @@ class WagentClient:
 
         Returns:
             ChatResult オブジェクト
+
+        Note:
+            キャッシュは会話コンテキストの混入を避けるため、
+            new_conversation=True の場合のみ参照・保存する。
         """
+        cache = self.cache if new_conversation else None
+        if cache is not None:
+            cached = cache.get(message)
+            if cached is not None:
+                logger.debug("Response served from cache")
+                return cached
+
         payload = {
             "message": message,
             "new_conversation": new_conversation,
@@ -172,7 +275,106 @@ class WagentClient:
             payload["timeout_ms"] = timeout_ms
 
         response = self._request("POST", "/v1/chat", json=payload)
-        return ChatResult.from_dict(response)
+        result = ChatResult.from_dict(response)
+
+        if cache is not None and result.success:
+            cache.set(message, result)
+        return result
+
+    def chat_batch(
+        self,
+        prompts: list[str],
+        new_conversation: bool = False,
+        timeout_ms: Optional[int] = None,
+    ) -> list[ChatResult]:
+        """
+        複数のプロンプトを1回のリクエストにまとめて送信
+
+        各質問を "### Q1", "### Q2", ... の見出しで連結し、回答を "### A1", ...
+        の見出しで分割する。N個の質問でもブラウザ往復は1回で済む。
+
+        Args:
+            prompts: 送信するプロンプトのリスト
+            new_conversation: 新しい会話を開始するかどうか
+            timeout_ms: レスポンス待機タイムアウト（ミリ秒）
+
+        Returns:
+            プロンプトと同じ順序の ChatResult のリスト
+            （elapsed_seconds はバッチ全体の処理時間）
+        """
+        if not prompts:
+            return []
+
+        sections = [_BATCH_INSTRUCTION.format(count=len(prompts))]
+        sections.extend(f"### Q{i}\n{prompt}" for i, prompt in enumerate(prompts, 1))
+        result = self.chat("\n\n".join(sections), new_conversation, timeout_ms)
+
+        if not result.success or result.message is None:
+            return [
+                ChatResult(
+                    success=False,
+                    message=None,
+                    error=result.error,
+                    elapsed_seconds=result.elapsed_seconds,
+                    prompt_length=len(prompt),
+                )
+                for prompt in prompts
+            ]
+
+        answers = _split_answers(result.message)
+
+        results = []
+        for i, prompt in enumerate(prompts, 1):
+            answer = answers.get(i)
+            results.append(
+                ChatResult(
+                    success=answer is not None,
+                    message=answer,
+                    error=None if answer is not None else f"Answer A{i} not found",
+                    elapsed_seconds=result.elapsed_seconds,
+                    prompt_length=len(prompt),
+                    response_length=len(answer) if answer is not None else None,
+                )
+            )
+        return results
+
+    def chat_parallel(
+        self,
+        prompts: list[str],
+        concurrency: int = 3,
+        new_conversation: bool = False,
+        timeout_ms: Optional[int] = None,
+    ) -> list[ChatResult]:
+        """
+        複数のプロンプトを並行して送信
+
+        最大 concurrency 件のリクエストを同時に発行する。サーバー側では
+        ブラウザ操作が直列化され、各リクエストは順番と最小間隔（min_interval）を
+        待ってから処理されるため、短縮されるのはHTTP往復の待ち時間のみ。
+        待ち時間が timeout を超えないよう、件数と concurrency を調整すること。
+
+        Args:
+            prompts: 送信するプロンプトのリスト
+            concurrency: 同時に発行するリクエスト数
+            new_conversation: 各プロンプトで新しい会話を開始するかどうか
+            timeout_ms: レスポンス待機タイムアウト（ミリ秒）
+
+        Returns:
+            プロンプトと同じ順序の ChatResult のリスト
+            （例外になったプロンプトは success=False の結果になる）
+        """
+        if not prompts:
+            return []
+
+        def run(prompt: str) -> ChatResult:
+            # 1件の失敗で他の結果を失わないよう、例外はその要素の結果にする
+            try:
+                return self.chat(prompt, new_conversation, timeout_ms)
+            except WagentClientError as e:
+                return _failed_result(e)
+
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            return list(executor.map(run, prompts))
 
     def ask(self, message: str, new_conversation: bool = False) -> Optional[str]:
         """
@@ -195,11 +397,19 @@ class WagentClient:
         """
         サーバーのステータスを取得
 
+        直前（STATUS_TTL 秒以内）に取得した結果があればそれを返す。
+
         Returns:
             StatusResult オブジェクト
         """
+        if (
+            self._last_status is not None
+            and time.monotonic() - self._last_status_time < self.STATUS_TTL
+        ):
+            return self._last_status
+
         response = self._request("GET", "/v1/status")
-        return StatusResult.from_dict(response)
+        return self._remember_status(StatusResult.from_dict(response))
 
     def reset_session(self) -> bool:
         """
@@ -218,44 +428,88 @@ class WagentClient:
         Returns:
             健全な場合True
         """
+        url = f"{self.base_url}/health"
         try:
-            response = self._session.get(
-                f"{self.base_url}/health",
-                timeout=5,
+            response = self._session.request(
+                self._health_verb, url, timeout=self.HEALTH_TIMEOUT
             )
-            return response.status_code == 200
+            # HEAD 非対応のサーバーでは以降 GET を使用
+            if response.status_code == 405 and self._health_verb == "HEAD":
+                self._health_verb = "GET"
+                response = self._session.get(url, timeout=self.HEALTH_TIMEOUT)
+            return 200 <= response.status_code < 300
         except requests.RequestException:
             return False
 
+    def prewarm(self) -> bool:
+        """
+        サーバーへの接続を事前に確立
+
+        最初の実リクエストより前に接続を張り、以降の呼び出しで再利用させる。
+
+        Returns:
+            接続できた場合True
+        """
+        return self.health()
+
     def wait_for_server(
         self,
         max_retries: int = 30,
         interval: float = 1.0,
-    ) -> bool:
+    ) -> Optional[StatusResult]:
         """
         サーバーが起動するまで待機
 
+        サーバーの /ready にロングポーリングし、ブラウザの初期化完了と同時に
+        ステータスを受け取る。サーバーがまだ接続を受け付けていない間のみ
+        短い間隔から指数的に延ばしながら（最大 interval 秒）再接続する。
+
         Args:
-            max_retries: 最大リトライ回数
-            interval: リトライ間隔（秒）
+            max_retries: 最大リトライ回数（待機上限は max_retries * interval 秒）
+            interval: 再接続の最大間隔（秒）
 
         Returns:
-            サーバーが起動した場合True
+            サーバーが起動した場合はそのステータス、タイムアウト・起動失敗時はNone
         """
-        for i in range(max_retries):
-            if self.health():
-                logger.info("Server is ready!")
-                return True
-            logger.debug(f"Waiting for server... ({i + 1}/{max_retries})")
-            time.sleep(interval)
+        deadline = time.monotonic() + max_retries * interval
+        delay = self.RECONNECT_INITIAL_DELAY
+
+        while (remaining := deadline - time.monotonic()) > 0:
+            try:
+                response = self._session.get(
+                    f"{self.base_url}/ready",
+                    params={"timeout": min(remaining, 300)},
+                    timeout=remaining + 5,
+                )
+                if response.status_code == 200:
+                    logger.info("Server is ready!")
+                    return self._remember_status(
+                        StatusResult.from_dict(_decode_json(response))
+                    )
+                failure = _startup_failure(response.status_code, response.content)
+                if failure is not None:
+                    logger.error(failure)
+                    return None
+            except requests.RequestException:
+                pass
+
+            logger.debug(f"Waiting for server... ({remaining:.0f}s left)")
+            time.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+            delay = min(delay * 1.5, interval)
 
         logger.error("Server did not respond")
-        return False
+        return None
 
     # =========================================================================
     # 内部メソッド
     # =========================================================================
 
+    def _remember_status(self, status: StatusResult) -> StatusResult:
+        """ステータスを短期間キャッシュ"""
+        self._last_status = status
+        self._last_status_time = time.monotonic()
+        return status
+
     def _request(
         self,
         method: str,
@@ -264,34 +518,49 @@ class WagentClient:
     ) -> dict[str, Any]:
         """APIリクエストを実行"""
         url = f"{self.base_url}{path}"
+        attempts = self.max_retries if self.auto_retry else 1
+
+        # リクエストボディは orjson でエンコード
+        body = kwargs.pop("json", None)
+        if body is not None:
+            kwargs["data"] = orjson.dumps(body)
+            kwargs["headers"] = _JSON_HEADERS
 
-        for attempt in range(self.max_retries if self.auto_retry else 1):
+        for attempt in range(attempts):
             try:
-                response = self._session.request(
+                # ボディは _decode_json でサイズに応じて読み込む
+                with self._session.request(
                     method,
                     url,
                     timeout=self.timeout,
+                    stream=True,
                     **kwargs,
-                )
-
-                # レートリミット
-                if response.status_code == 429:
-                    raise RateLimitError("Rate limit exceeded")
-
-                response.raise_for_status()
-                return response.json()
+                ) as response:
+                    # レートリミット（Retry-After に従って待機してから再試行）
+                    if response.status_code == 429:
+                        retry_after = _parse_retry_after(response)
+                        if attempt == attempts - 1:
+                            raise RateLimitError(
+                                "Rate limit exceeded", retry_after=retry_after
+                            )
+                        time.sleep(_rate_limit_delay(retry_after, attempt))
+                        continue
+
+                    if not 200 <= response.status_code < 300:
+                        return _http_error(response.status_code, response.reason, url)
+                    return _decode_json(response)
 
             except requests.ConnectionError as e:
-                if attempt == self.max_retries - 1:
+                if attempt == attempts - 1:
                     raise ConnectionError(f"Failed to connect: {e}") from e
-                time.sleep(1)
+                time.sleep(_backoff_delay(attempt))
 
             except requests.Timeout as e:
-                if attempt == self.max_retries - 1:
+                if attempt == attempts - 1:
                     raise TimeoutError(f"Request timed out: {e}") from e
-                time.sleep(1)
+                time.sleep(_backoff_delay(attempt))
 
-            except requests.RequestException as e:
+            except (requests.RequestException, orjson.JSONDecodeError) as e:
                 logger.error(f"Request failed: {e}")
                 return {"success": False, "error": str(e)}
 
@@ -301,11 +570,318 @@ class WagentClient:
     # コンテキストマネージャー
     # =========================================================================
 
+    def close(self) -> None:
+        """コネクションプールを閉じる（共有セッションは閉じない）"""
+        if self._owns_session:
+            self._session.close()
+
     def __enter__(self) -> WagentClient:
         return self
 
     def __exit__(self, *args: Any) -> None:
-        self._session.close()
+        self.close()
+
+
+# =============================================================================
+# 非同期クライアント
+# =============================================================================
+
+
+class AsyncWagentClient:
+    """
+    Wagent API 非同期クライアント（httpx が必要）
+
+    1つのコネクションプールを共有したまま、複数のリクエストを
+    asyncio.gather で同時に発行できる。
+
+    Usage:
+        async with AsyncWagentClient() as client:
+            results = await asyncio.gather(*(client.chat(p) for p in prompts))
+    """
+
+    DEFAULT_BASE_URL = WagentClient.DEFAULT_BASE_URL
+    DEFAULT_TIMEOUT = WagentClient.DEFAULT_TIMEOUT
+    MAX_CONNECTIONS = 64
+    MAX_KEEPALIVE_CONNECTIONS = 32
+    RECONNECT_INITIAL_DELAY = WagentClient.RECONNECT_INITIAL_DELAY
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: int = DEFAULT_TIMEOUT,
+        auto_retry: bool = True,
+        max_retries: int = 3,
+    ) -> None:
+        """
+        Args:
+            base_url: WagentサーバーのベースURL
+            timeout: リクエストタイムアウト（秒）
+            auto_retry: 失敗時に自動リトライするか
+            max_retries: 最大リトライ回数
+        """
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "httpx is required for AsyncWagentClient. "
+                "Install it with: pip install wagent[async]"
+            ) from e
+
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.auto_retry = auto_retry
+        self.max_retries = max_retries
+        self._httpx = httpx
+        self._health_verb = "HEAD"
+        connect_timeout, read_timeout = WagentClient.HEALTH_TIMEOUT
+        self._health_timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=self.MAX_CONNECTIONS,
+                max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+
+    # =========================================================================
+    # パブリックAPI
+    # =========================================================================
+
+    async def chat(
+        self,
+        message: str,
+        new_conversation: bool = False,
+        timeout_ms: Optional[int] = None,
+    ) -> ChatResult:
+        """
+        メッセージを送信し、レスポンスを取得
+
+        Args:
+            message: 送信するプロンプト
+            new_conversation: 新しい会話を開始するかどうか
+            timeout_ms: レスポンス待機タイムアウト（ミリ秒）
+
+        Returns:
+            ChatResult オブジェクト
+        """
+        payload = {
+            "message": message,
+            "new_conversation": new_conversation,
+        }
+        if timeout_ms is not None:
+            payload["timeout_ms"] = timeout_ms
+
+        response = await self._request("POST", "/v1/chat", json=payload)
+        return ChatResult.from_dict(response)
+
+    async def chat_parallel(
+        self,
+        prompts: list[str],
+        concurrency: int = 3,
+        new_conversation: bool = False,
+        timeout_ms: Optional[int] = None,
+    ) -> list[ChatResult]:
+        """
+        複数のプロンプトを並行して送信
+
+        最大 concurrency 件のリクエストを同時に発行する。
+        WagentClient.chat_parallel と同様、サーバー側では1件ずつ順番に処理される。
+
+        Args:
+            prompts: 送信するプロンプトのリスト
+            concurrency: 同時に発行するリクエスト数
+            new_conversation: 各プロンプトで新しい会話を開始するかどうか
+            timeout_ms: レスポンス待機タイムアウト（ミリ秒）
+
+        Returns:
+            プロンプトと同じ順序の ChatResult のリスト
+            （例外になったプロンプトは success=False の結果になる）
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def run(prompt: str) -> ChatResult:
+            async with semaphore:
+                try:
+                    return await self.chat(prompt, new_conversation, timeout_ms)
+                except WagentClientError as e:
+                    return _failed_result(e)
+
+        return list(await asyncio.gather(*(run(prompt) for prompt in prompts)))
+
+    async def ask(self, message: str, new_conversation: bool = False) -> Optional[str]:
+        """
+        シンプルなインターフェース - メッセージを送信してテキストのみを返す
+
+        Args:
+            message: 送信するプロンプト
+            new_conversation: 新しい会話を開始するかどうか
+
+        Returns:
+            レスポンステキスト、エラー時はNone
+        """
+        result = await self.chat(message, new_conversation)
+        if result.success:
+            return result.message
+        logger.error(f"Chat failed: {result.error}")
+        return None
+
+    async def status(self) -> StatusResult:
+        """
+        サーバーのステータスを取得
+
+        Returns:
+            StatusResult オブジェクト
+        """
+        response = await self._request("GET", "/v1/status")
+        return StatusResult.from_dict(response)
+
+    async def reset_session(self) -> bool:
+        """
+        セッション（チャット履歴）をリセット
+
+        Returns:
+            成功した場合True
+        """
+        response = await self._request("DELETE", "/v1/session")
+        return response.get("success", False)
+
+    async def health(self) -> bool:
+        """
+        サーバーのヘルスチェック
+
+        Returns:
+            健全な場合True
+        """
+        try:
+            response = await self._client.request(
+                self._health_verb, "/health", timeout=self._health_timeout
+            )
+            # HEAD 非対応のサーバーでは以降 GET を使用
+            if response.status_code == 405 and self._health_verb == "HEAD":
+                self._health_verb = "GET"
+                response = await self._client.get(
+                    "/health", timeout=self._health_timeout
+                )
+            return response.is_success
+        except self._httpx.HTTPError:
+            return False
+
+    async def wait_for_server(
+        self,
+        max_retries: int = 30,
+        interval: float = 1.0,
+    ) -> Optional[StatusResult]:
+        """
+        サーバーが起動するまで待機
+
+        WagentClient.wait_for_server と同様に /ready にロングポーリングし、
+        接続できない間は指数的に間隔を延ばしながら再接続する。
+
+        Args:
+            max_retries: 最大リトライ回数（待機上限は max_retries * interval 秒）
+            interval: 再接続の最大間隔（秒）
+
+        Returns:
+            サーバーが起動した場合はそのステータス、タイムアウト・起動失敗時はNone
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_retries * interval
+        delay = self.RECONNECT_INITIAL_DELAY
+
+        while (remaining := deadline - loop.time()) > 0:
+            try:
+                response = await self._client.get(
+                    "/ready",
+                    params={"timeout": min(remaining, 300)},
+                    timeout=remaining + 5,
+                )
+                if response.status_code == 200:
+                    logger.info("Server is ready!")
+                    return StatusResult.from_dict(orjson.loads(response.content))
+                failure = _startup_failure(response.status_code, response.content)
+                if failure is not None:
+                    logger.error(failure)
+                    return None
+            except self._httpx.HTTPError:
+                pass
+
+            logger.debug(f"Waiting for server... ({remaining:.0f}s left)")
+            await asyncio.sleep(min(delay, max(deadline - loop.time(), 0)))
+            delay = min(delay * 1.5, interval)
+
+        logger.error("Server did not respond")
+        return None
+
+    # =========================================================================
+    # 内部メソッド
+    # =========================================================================
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """APIリクエストを実行"""
+        httpx = self._httpx
+        attempts = self.max_retries if self.auto_retry else 1
+
+        # リクエストボディは orjson でエンコード
+        body = kwargs.pop("json", None)
+        if body is not None:
+            kwargs["content"] = orjson.dumps(body)
+            kwargs["headers"] = _JSON_HEADERS
+
+        for attempt in range(attempts):
+            try:
+                response = await self._client.request(method, path, **kwargs)
+
+                # レートリミット（Retry-After に従って待機してから再試行）
+                if response.status_code == 429:
+                    retry_after = _parse_retry_after(response)
+                    if attempt == attempts - 1:
+                        raise RateLimitError(
+                            "Rate limit exceeded", retry_after=retry_after
+                        )
+                    await asyncio.sleep(_rate_limit_delay(retry_after, attempt))
+                    continue
+
+                if not response.is_success:
+                    return _http_error(
+                        response.status_code, response.reason_phrase, str(response.url)
+                    )
+                return orjson.loads(response.content) if response.content else {}
+
+            except httpx.ConnectError as e:
+                if attempt == attempts - 1:
+                    raise ConnectionError(f"Failed to connect: {e}") from e
+                await asyncio.sleep(_backoff_delay(attempt))
+
+            except httpx.TimeoutException as e:
+                if attempt == attempts - 1:
+                    raise TimeoutError(f"Request timed out: {e}") from e
+                await asyncio.sleep(_backoff_delay(attempt))
+
+            except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+                logger.error(f"Request failed: {e}")
+                return {"success": False, "error": str(e)}
+
+        return {"success": False, "error": "Max retries exceeded"}
+
+    # =========================================================================
+    # コンテキストマネージャー
+    # =========================================================================
+
+    async def close(self) -> None:
+        """コネクションプールを閉じる"""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> AsyncWagentClient:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
 
 
 # =============================================================================
@@ -313,6 +889,94 @@ class WagentClient:
 # =============================================================================
 
 
+def _split_answers(text: str) -> dict[int, str]:
+    """
+    バッチ回答を見出し番号ごとに分割
+
+    見出しの位置だけを走査し、回答本文は元の文字列からスライスする。
+    同じ番号が複数ある場合は最初のものを採用する。
+    """
+    answers: dict[int, str] = {}
+    matches = list(_ANSWER_HEADER_PATTERN.finditer(text))
+    ends = [m.start() for m in matches[1:]] + [len(text)]
+
+    for match, end in zip(matches, ends):
+        answers.setdefault(int(match.group(1)), text[match.end() : end].strip())
+    return answers
+
+
+def _decode_json(response: requests.Response) -> dict[str, Any]:
+    """
+    レスポンスボディを orjson でデコード（空ボディは空辞書）
+
+    大きなボディ（_STREAM_THRESHOLD 超）はチャンクごとに1つのバッファへ
+    読み込み、中間のチャンクリストと結合時のコピーを作らない。
+    """
+    length = response.headers.get("Content-Length")
+    if length == "0":
+        return {}
+    if length is not None and length.isdigit() and int(length) > _STREAM_THRESHOLD:
+        data = bytearray()
+        for chunk in response.iter_content(_STREAM_CHUNK_SIZE):
+            data += chunk
+        return orjson.loads(data)
+    return orjson.loads(response.content)
+
+
+def _http_error(status_code: int, reason: str, url: str) -> dict[str, Any]:
+    """2xx 以外のレスポンスをエラー結果に変換"""
+    error = f"{status_code} {reason} for url: {url}"
+    logger.error(f"Request failed: {error}")
+    return {"success": False, "error": error}
+
+
+def _backoff_delay(attempt: int) -> float:
+    """リトライ前の待機時間（指数バックオフ + ジッター、最大30秒）"""
+    return min(30.0, (2**attempt) * 0.5) + random.uniform(0, 0.25)
+
+
+def _rate_limit_delay(retry_after: Optional[float], attempt: int) -> float:
+    """429 受信後の待機時間（並行リクエストが同時に再試行しないようジッターを加える）"""
+    if retry_after is None:
+        return _backoff_delay(attempt)
+    return retry_after + random.uniform(0, max(1.0, retry_after))
+
+
+def _failed_result(error: Exception) -> ChatResult:
+    """例外を失敗の ChatResult に変換"""
+    return ChatResult(
+        success=False,
+        message=None,
+        error=str(error),
+        elapsed_seconds=0.0,
+        retry_after=getattr(error, "retry_after", None),
+    )
+
+
+def _startup_failure(status_code: int, content: bytes) -> Optional[str]:
+    """
+    /ready の 503 応答からサーバーの起動失敗メッセージを取り出す
+
+    プロキシ等が返す 503（JSON の detail を持たない）は起動待ちとして扱い None を返す。
+    """
+    if status_code != 503:
+        return None
+    try:
+        detail = orjson.loads(content).get("detail")
+    except (orjson.JSONDecodeError, AttributeError):
+        return None
+    return detail if isinstance(detail, str) else None
+
+
+def _parse_retry_after(response: Any) -> Optional[float]:
+    """Retry-After ヘッダー（秒数）を取得"""
+    value = response.headers.get("Retry-After")
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
 def ask_chatgpt(
     prompt: str,
     server_url: str = "http://127.0.0.1:8765",
@@ -320,6 +984,9 @@ def ask_chatgpt(
     """
     ワンショットでChatGPTに質問する便利関数
 
+    同じ server_url への呼び出しではクライアント（コネクションプール）を
+    使い回す。
+
     Args:
         prompt: プロンプト
         server_url: WagentサーバーのURL
@@ -327,5 +994,15 @@ def ask_chatgpt(
     Returns:
         レスポンステキスト
     """
-    with WagentClient(server_url) as client:
-        return client.ask(prompt)
+    return _get_shared_client(server_url).ask(prompt)
+
+
+@lru_cache(maxsize=8)
+def _get_shared_client(server_url: str) -> WagentClient:
+    """
+    ask_chatgpt 用の共有クライアントを取得
+
+    キャッシュから外れたクライアントは参照がなくなった時点で破棄され、
+    セッションの接続も解放される。
+    """
+    return WagentClient(server_url)
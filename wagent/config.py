@@ -7,19 +7,40 @@ Pydanticを使用したバリデーション付き。
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import random
+import threading
+from dataclasses import dataclass, field, fields, is_dataclass
 from pathlib import Path
-from typing import Any, ClassVar, Optional
+from typing import Any, ClassVar, Optional, TypeVar
 
-import yaml
 from loguru import logger
 
+_T = TypeVar("_T")
+
+# 既定の設定ディレクトリ（リポジトリ直下の config/）
+_DEFAULT_CONFIG_DIR = Path(__file__).resolve().parent.parent / "config"
+
+
+def _read_yaml(filepath: Path) -> dict[str, Any]:
+    """
+    YAMLファイルを読み込んで辞書を返す（空ファイルは空辞書）
+
+    yaml は設定を読み込む時点で初めてインポートする。libyaml（C実装）が
+    利用可能ならそちらを使用。
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(filepath, encoding="utf-8") as f:
+        return yaml.load(f, Loader=loader) or {}
+
+
 # =============================================================================
 # 設定データクラス
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ViewportConfig:
     """ビューポート設定"""
 
@@ -27,7 +48,7 @@ class ViewportConfig:
     height: int = 800
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CorsConfig:
     """CORS設定"""
 
@@ -35,7 +56,7 @@ class CorsConfig:
     origins: tuple[str, ...] = ("*",)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ServerConfig:
     """サーバー設定"""
 
@@ -45,7 +66,7 @@ class ServerConfig:
     cors: CorsConfig = field(default_factory=CorsConfig)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BrowserConfig:
     """ブラウザ設定"""
 
@@ -54,10 +75,11 @@ class BrowserConfig:
     viewport: ViewportConfig = field(default_factory=ViewportConfig)
     slow_mo: int = 0
     timeout: int = 30000
-    wait_until: str = "networkidle"
+    wait_until: str = "domcontentloaded"
+    perf_flags: bool = True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserAgentConfig:
     """ユーザーエージェント設定"""
 
@@ -66,7 +88,7 @@ class UserAgentConfig:
     preset: str = "chrome_windows"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FingerprintConfig:
     """フィンガープリント偽装設定"""
 
@@ -75,7 +97,7 @@ class FingerprintConfig:
     webgl_renderer: str = "ANGLE (NVIDIA, NVIDIA GeForce RTX 3080)"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PluginsConfig:
     """プラグイン偽装設定"""
 
@@ -83,7 +105,7 @@ class PluginsConfig:
     count: int = 5
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StealthConfig:
     """ステルス設定"""
 
@@ -96,7 +118,7 @@ class StealthConfig:
     plugins: PluginsConfig = field(default_factory=PluginsConfig)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TypingConfig:
     """タイピング設定"""
 
@@ -105,9 +127,11 @@ class TypingConfig:
     word_pause_probability: float = 0.1
     word_pause_min: int = 100
     word_pause_max: int = 300
+    fast_mode: bool = False
+    insert_chunks: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MouseConfig:
     """マウス設定"""
 
@@ -115,7 +139,7 @@ class MouseConfig:
     speed: int = 10
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActionDelayConfig:
     """アクション遅延設定"""
 
@@ -123,7 +147,7 @@ class ActionDelayConfig:
     max: int = 1500
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RandomPauseConfig:
     """ランダム休憩設定"""
 
@@ -134,7 +158,7 @@ class RandomPauseConfig:
     duration_max: int = 3000
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HumanBehaviorConfig:
     """人間らしい挙動設定"""
 
@@ -144,7 +168,7 @@ class HumanBehaviorConfig:
     random_pause: RandomPauseConfig = field(default_factory=RandomPauseConfig)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RateLimitConfig:
     """レートリミット設定"""
 
@@ -154,16 +178,17 @@ class RateLimitConfig:
     burst_limit: int = 3
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SessionConfig:
     """セッション設定"""
 
     keepalive_interval: int = 300
     timeout: int = 3600
     auto_recovery: bool = True
+    storage_state_path: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LoggingConfig:
     """ログ設定"""
 
@@ -178,6 +203,26 @@ class LoggingConfig:
     )
 
 
+def _build(cls: type[_T], data: Optional[dict[str, Any]]) -> _T:
+    """
+    データクラスのフィールド定義に従って辞書から設定を構築
+
+    既定値はデータクラス側の定義を使用し、ネストしたデータクラスは再帰的に
+    構築する。リストはイミュータブルなタプルに変換する。
+    """
+    data = data or {}
+    kwargs: dict[str, Any] = {}
+
+    for f in fields(cls):  # type: ignore[arg-type]
+        if is_dataclass(f.default_factory):
+            kwargs[f.name] = _build(f.default_factory, data.get(f.name))
+        elif f.name in data:
+            value = data[f.name]
+            kwargs[f.name] = tuple(value) if isinstance(value, list) else value
+
+    return cls(**kwargs)
+
+
 # =============================================================================
 # ユーザーエージェントプリセット
 # =============================================================================
@@ -218,6 +263,7 @@ class UserAgentPresets:
         "firefox_windows": FIREFOX_WINDOWS,
         "safari_mac": SAFARI_MAC,
     }
+    _VALUES: ClassVar[tuple[str, ...]] = tuple(_PRESETS.values())
 
     @classmethod
     def get(cls, name: str) -> str:
@@ -227,9 +273,7 @@ class UserAgentPresets:
     @classmethod
     def random(cls) -> str:
         """ランダムなUAを取得"""
-        import random
-
-        return random.choice(list(cls._PRESETS.values()))
+        return random.choice(cls._VALUES)
 
 
 # =============================================================================
@@ -251,7 +295,8 @@ class Config:
     """
 
     _instance: ClassVar[Optional[Config]] = None
-    _config_dir: ClassVar[Path] = Path(__file__).parent.parent / "config"
+    _lock: ClassVar[threading.RLock] = threading.RLock()
+    _config_dir: ClassVar[Path] = _DEFAULT_CONFIG_DIR
 
     def __init__(
         self,
@@ -270,6 +315,7 @@ class Config:
         self.rate_limit = rate_limit
         self.session = session
         self.logging = logging
+        self._user_agent: Optional[str] = None
 
     @classmethod
     def load(cls, config_dir: Optional[Path] = None) -> Config:
@@ -285,20 +331,24 @@ class Config:
         if cls._instance is not None:
             return cls._instance
 
-        if config_dir is not None:
-            cls._config_dir = Path(config_dir)
+        # 複数スレッドから同時に初回呼び出しされても読み込みは1回のみ
+        with cls._lock:
+            if cls._instance is None:
+                if config_dir is not None:
+                    cls._config_dir = Path(config_dir)
 
-        settings = cls._load_yaml("settings.yaml")
-        cls._instance = cls._parse_settings(settings)
+                settings = cls._load_yaml("settings.yaml")
+                cls._instance = cls._parse_settings(settings)
 
-        logger.info(f"Configuration loaded from {cls._config_dir}")
-        return cls._instance
+                logger.info(f"Configuration loaded from {cls._config_dir}")
+            return cls._instance
 
     @classmethod
     def reload(cls) -> Config:
         """設定をリロード"""
-        cls._instance = None
-        return cls.load()
+        with cls._lock:
+            cls._instance = None
+            return cls.load()
 
     @classmethod
     def _load_yaml(cls, filename: str) -> dict[str, Any]:
@@ -308,152 +358,36 @@ class Config:
             logger.warning(f"Config file not found: {filepath}")
             return {}
 
-        with open(filepath, encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+        return _read_yaml(filepath)
 
     @classmethod
     def _parse_settings(cls, data: dict[str, Any]) -> Config:
         """設定データをパースしてConfigインスタンスを生成"""
         return Config(
-            server=cls._parse_server(data.get("server", {})),
-            browser=cls._parse_browser(data.get("browser", {})),
-            stealth=cls._parse_stealth(data.get("stealth", {})),
-            human_behavior=cls._parse_human_behavior(data.get("human_behavior", {})),
-            rate_limit=cls._parse_rate_limit(data.get("rate_limit", {})),
-            session=cls._parse_session(data.get("session", {})),
-            logging=cls._parse_logging(data.get("logging", {})),
-        )
-
-    @staticmethod
-    def _parse_server(data: dict[str, Any]) -> ServerConfig:
-        cors_data = data.get("cors", {})
-        return ServerConfig(
-            host=data.get("host", "127.0.0.1"),
-            port=data.get("port", 8765),
-            debug=data.get("debug", True),
-            cors=CorsConfig(
-                enabled=cors_data.get("enabled", True),
-                origins=tuple(cors_data.get("origins", ["*"])),
-            ),
-        )
-
-    @staticmethod
-    def _parse_browser(data: dict[str, Any]) -> BrowserConfig:
-        viewport_data = data.get("viewport", {})
-        return BrowserConfig(
-            headless=data.get("headless", False),
-            user_data_dir=data.get("user_data_dir", "./browser_data"),
-            viewport=ViewportConfig(
-                width=viewport_data.get("width", 1280),
-                height=viewport_data.get("height", 800),
-            ),
-            slow_mo=data.get("slow_mo", 0),
-            timeout=data.get("timeout", 30000),
-            wait_until=data.get("wait_until", "networkidle"),
-        )
-
-    @staticmethod
-    def _parse_stealth(data: dict[str, Any]) -> StealthConfig:
-        ua_data = data.get("user_agent", {})
-        fp_data = data.get("fingerprint", {})
-        plugins_data = data.get("plugins", {})
-
-        return StealthConfig(
-            enabled=data.get("enabled", True),
-            hide_webdriver=data.get("hide_webdriver", True),
-            user_agent=UserAgentConfig(
-                custom=ua_data.get("custom"),
-                random=ua_data.get("random", False),
-                preset=ua_data.get("preset", "chrome_windows"),
-            ),
-            locale=data.get("locale", "ja-JP"),
-            timezone=data.get("timezone", "Asia/Tokyo"),
-            fingerprint=FingerprintConfig(
-                enabled=fp_data.get("enabled", True),
-                webgl_vendor=fp_data.get("webgl_vendor", "Google Inc. (NVIDIA)"),
-                webgl_renderer=fp_data.get(
-                    "webgl_renderer", "ANGLE (NVIDIA, NVIDIA GeForce RTX 3080)"
-                ),
-            ),
-            plugins=PluginsConfig(
-                enabled=plugins_data.get("enabled", True),
-                count=plugins_data.get("count", 5),
-            ),
-        )
-
-    @staticmethod
-    def _parse_human_behavior(data: dict[str, Any]) -> HumanBehaviorConfig:
-        typing_data = data.get("typing", {})
-        mouse_data = data.get("mouse", {})
-        action_data = data.get("action_delay", {})
-        pause_data = data.get("random_pause", {})
-
-        return HumanBehaviorConfig(
-            typing=TypingConfig(
-                min_delay=typing_data.get("min_delay", 30),
-                max_delay=typing_data.get("max_delay", 120),
-                word_pause_probability=typing_data.get("word_pause_probability", 0.1),
-                word_pause_min=typing_data.get("word_pause_min", 100),
-                word_pause_max=typing_data.get("word_pause_max", 300),
-            ),
-            mouse=MouseConfig(
-                natural_movement=mouse_data.get("natural_movement", True),
-                speed=mouse_data.get("speed", 10),
-            ),
-            action_delay=ActionDelayConfig(
-                min=action_data.get("min", 500),
-                max=action_data.get("max", 1500),
-            ),
-            random_pause=RandomPauseConfig(
-                enabled=pause_data.get("enabled", False),
-                interval_min=pause_data.get("interval_min", 60000),
-                interval_max=pause_data.get("interval_max", 300000),
-                duration_min=pause_data.get("duration_min", 1000),
-                duration_max=pause_data.get("duration_max", 3000),
-            ),
-        )
-
-    @staticmethod
-    def _parse_rate_limit(data: dict[str, Any]) -> RateLimitConfig:
-        return RateLimitConfig(
-            enabled=data.get("enabled", True),
-            requests_per_minute=data.get("requests_per_minute", 10),
-            min_interval=data.get("min_interval", 3),
-            burst_limit=data.get("burst_limit", 3),
-        )
-
-    @staticmethod
-    def _parse_session(data: dict[str, Any]) -> SessionConfig:
-        return SessionConfig(
-            keepalive_interval=data.get("keepalive_interval", 300),
-            timeout=data.get("timeout", 3600),
-            auto_recovery=data.get("auto_recovery", True),
-        )
-
-    @staticmethod
-    def _parse_logging(data: dict[str, Any]) -> LoggingConfig:
-        return LoggingConfig(
-            level=data.get("level", "DEBUG"),
-            file=data.get("file", "./logs/wagent.log"),
-            rotation=data.get("rotation", "10 MB"),
-            retention=data.get("retention", 5),
-            format=data.get(
-                "format",
-                "<green>{time:HH:mm:ss}</green> | "
-                "<level>{level: <8}</level> | "
-                "<cyan>{name}</cyan> - <level>{message}</level>",
-            ),
+            server=_build(ServerConfig, data.get("server")),
+            browser=_build(BrowserConfig, data.get("browser")),
+            stealth=_build(StealthConfig, data.get("stealth")),
+            human_behavior=_build(HumanBehaviorConfig, data.get("human_behavior")),
+            rate_limit=_build(RateLimitConfig, data.get("rate_limit")),
+            session=_build(SessionConfig, data.get("session")),
+            logging=_build(LoggingConfig, data.get("logging")),
         )
 
     def get_user_agent(self) -> str:
-        """設定に基づいてユーザーエージェントを取得"""
+        """
+        設定に基づいてユーザーエージェントを取得
+
+        ランダム指定以外は結果が変わらないため、初回の値を再利用する。
+        """
         ua_config = self.stealth.user_agent
 
-        if ua_config.custom:
-            return ua_config.custom
         if ua_config.random:
             return UserAgentPresets.random()
-        return UserAgentPresets.get(ua_config.preset)
+        if self._user_agent is None:
+            self._user_agent = ua_config.custom or UserAgentPresets.get(
+                ua_config.preset
+            )
+        return self._user_agent
 
 
 # =============================================================================
@@ -469,10 +403,25 @@ class Selectors:
     """
 
     _instance: ClassVar[Optional[Selectors]] = None
+    _lock: ClassVar[threading.RLock] = threading.RLock()
     _data: dict[str, Any]
+    _flat: dict[str, str]
 
     def __init__(self, data: dict[str, Any]) -> None:
         self._data = data
+        self._flat = self._flatten(data)
+
+    @staticmethod
+    def _flatten(data: dict[str, Any], prefix: str = "") -> dict[str, str]:
+        """ネストした辞書をドット区切りのキーで平坦化（末端の値のみ）"""
+        flat: dict[str, str] = {}
+        for key, value in data.items():
+            path = f"{prefix}{key}"
+            if isinstance(value, dict):
+                flat.update(Selectors._flatten(value, f"{path}."))
+            elif value is not None:
+                flat[path] = str(value)
+        return flat
 
     @classmethod
     def load(cls, config_dir: Optional[Path] = None) -> Selectors:
@@ -480,20 +429,31 @@ class Selectors:
         if cls._instance is not None:
             return cls._instance
 
-        config_dir = config_dir or Path(__file__).parent.parent / "config"
-        filepath = config_dir / "selectors.yaml"
+        # 複数スレッドから同時に初回呼び出しされても読み込みは1回のみ
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls._read(config_dir)
+            return cls._instance
+
+    @classmethod
+    def _read(cls, config_dir: Optional[Path]) -> Selectors:
+        """セレクタファイルを読み込んでインスタンスを生成"""
+        filepath = (config_dir or _DEFAULT_CONFIG_DIR) / "selectors.yaml"
 
         if not filepath.exists():
             logger.warning(f"Selectors file not found: {filepath}")
-            cls._instance = cls({})
-            return cls._instance
+            return cls({})
 
-        with open(filepath, encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
-
-        cls._instance = cls(data)
+        selectors = cls(_read_yaml(filepath))
         logger.debug("Selectors loaded")
-        return cls._instance
+        return selectors
+
+    @classmethod
+    def reload(cls, config_dir: Optional[Path] = None) -> Selectors:
+        """セレクタファイルをリロード（平坦化したテーブルも再構築される）"""
+        with cls._lock:
+            cls._instance = None
+            return cls.load(config_dir)
 
     def get(self, path: str, default: Optional[str] = None) -> Optional[str]:
         """
@@ -506,19 +466,11 @@ class Selectors:
         Returns:
             セレクタ文字列
         """
-        keys = path.split(".")
-        value: Any = self._data
-
-        try:
-            for key in keys:
-                value = value[key]
-            return str(value) if value is not None else default
-        except (KeyError, TypeError):
-            return default
+        return self._flat.get(path, default)
 
     def __getitem__(self, path: str) -> str:
         """角括弧記法でのアクセス"""
-        result = self.get(path)
-        if result is None:
-            raise KeyError(f"Selector not found: {path}")
-        return result
+        try:
+            return self._flat[path]
+        except KeyError:
+            raise KeyError(f"Selector not found: {path}") from None
@@ -7,14 +7,17 @@ Main - Wagentエントリーポイント
 from __future__ import annotations
 
 import argparse
-import asyncio
+import functools
 import sys
+import threading
 from pathlib import Path
-from typing import TYPE_CHECKING, NoReturn
-
-from loguru import logger
+from typing import TYPE_CHECKING, Awaitable, Callable, NoReturn
 
+# --help / --version を軽く保つため、loguru・asyncio・ブラウザ関連は
+# 必要になった関数内で遅延インポートする
 if TYPE_CHECKING:
+    import asyncio
+
     from wagent.browser import BrowserController
 
 # =============================================================================
@@ -22,21 +25,28 @@ if TYPE_CHECKING:
 # =============================================================================
 
 
+_LOG_FORMAT = (
+    "<green>{time:HH:mm:ss}</green> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{name}</cyan> - <level>{message}</level>"
+)
+_PLAIN_LOG_FORMAT = "{time:HH:mm:ss} | {level: <8} | {name} - {message}"
+
+
 def setup_logging(level: str = "INFO", log_file: str | None = None) -> None:
     """ロギングを設定"""
+    from loguru import logger
+
     # デフォルトハンドラーを削除
     logger.remove()
 
-    # コンソール出力
+    # コンソール出力（端末以外へのリダイレクト時は色付けしない）
+    is_tty = sys.stderr.isatty()
     logger.add(
         sys.stderr,
-        format=(
-            "<green>{time:HH:mm:ss}</green> | "
-            "<level>{level: <8}</level> | "
-            "<cyan>{name}</cyan> - <level>{message}</level>"
-        ),
+        format=_LOG_FORMAT if is_tty else _PLAIN_LOG_FORMAT,
         level=level,
-        colorize=True,
+        colorize=is_tty,
     )
 
     # ファイル出力
@@ -56,11 +66,51 @@ def setup_logging(level: str = "INFO", log_file: str | None = None) -> None:
 # =============================================================================
 
 
+async def _ainput(prompt: str = "") -> str:
+    """イベントループを止めずに標準入力から1行読む
+
+    ``input()`` はデーモンスレッドで実行するため、入力待ちの間も
+    ブラウザ側のタスクは進行し、Ctrl+C での終了も待たされない。
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[str] = loop.create_future()
+
+    def _resolve(result: str | None, error: BaseException | None) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result or "")
+
+    def _read() -> None:
+        try:
+            line = input(prompt)
+        except BaseException as e:  # EOFError などもループ側へ伝える
+            loop.call_soon_threadsafe(_resolve, None, e)
+        else:
+            loop.call_soon_threadsafe(_resolve, line, None)
+
+    threading.Thread(target=_read, name="wagent-input", daemon=True).start()
+    return await future
+
+
 async def run_interactive_mode() -> None:
     """対話モードで実行"""
+    import asyncio
+
+    from loguru import logger
+
     from wagent.browser import BrowserController
     from wagent.config import Config, Selectors
 
+    try:
+        import readline  # noqa: F401  input() に行編集・履歴を付与
+    except ImportError:  # Windows などでは未提供
+        pass
+
     config = Config.load()
     selectors = Selectors.load()
 
@@ -78,13 +128,13 @@ async def run_interactive_mode() -> None:
             logger.warning("Not logged in!")
             logger.info("Please log in manually in the browser window.")
             logger.info("Press Enter when you've logged in...")
-            input()
+            await _ainput()
 
         print_interactive_help()
 
         while True:
             try:
-                prompt = input("\n[You] > ").strip()
+                prompt = (await _ainput("\n[You] > ")).strip()
 
                 if not prompt:
                     continue
@@ -103,7 +153,7 @@ async def run_interactive_mode() -> None:
                 response = await browser.wait_for_response()
                 print(f"\n[ChatGPT]\n{response}")
 
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, asyncio.CancelledError, EOFError):
                 print("\n")
                 break
             except Exception as e:
@@ -112,10 +162,7 @@ async def run_interactive_mode() -> None:
     logger.info("Goodbye!")
 
 
-def print_interactive_help() -> None:
-    """対話モードのヘルプを表示"""
-    print(
-        """
+_HELP_TEXT = """
 ╔══════════════════════════════════════════════════════════════╗
 ║                    Wagent Interactive Mode                   ║
 ╠══════════════════════════════════════════════════════════════╣
@@ -129,8 +176,58 @@ def print_interactive_help() -> None:
 ║  Enter your prompt and press Enter to send.                  ║
 ║  Press Ctrl+C to exit.                                       ║
 ╚══════════════════════════════════════════════════════════════╝
+
 """
-    )
+
+
+def print_interactive_help() -> None:
+    """対話モードのヘルプを表示"""
+    sys.stdout.write(_HELP_TEXT)
+    sys.stdout.flush()
+
+
+async def _cmd_quit(browser: BrowserController) -> bool:
+    return True
+
+
+async def _cmd_new(browser: BrowserController) -> bool:
+    from loguru import logger
+
+    await browser.new_chat()
+    logger.info("Started new chat")
+    return False
+
+
+async def _cmd_screenshot(browser: BrowserController) -> bool:
+    from loguru import logger
+
+    path = await browser.screenshot()
+    logger.info(f"Screenshot saved: {path}")
+    return False
+
+
+async def _cmd_status(browser: BrowserController) -> bool:
+    logged_in = await browser.is_logged_in()
+    status = "Logged in ✓" if logged_in else "Not logged in ✗"
+    print(f"Status: {status}")
+    return False
+
+
+async def _cmd_help(browser: BrowserController) -> bool:
+    print_interactive_help()
+    return False
+
+
+# コマンド名 -> ハンドラー（戻り値は終了する場合True）
+_COMMANDS: dict[str, Callable[[BrowserController], Awaitable[bool]]] = {
+    "/quit": _cmd_quit,
+    "/exit": _cmd_quit,
+    "/q": _cmd_quit,
+    "/new": _cmd_new,
+    "/screenshot": _cmd_screenshot,
+    "/status": _cmd_status,
+    "/help": _cmd_help,
+}
 
 
 async def handle_command(command: str, browser: BrowserController) -> bool:
@@ -140,33 +237,13 @@ async def handle_command(command: str, browser: BrowserController) -> bool:
     Returns:
         終了する場合はTrue
     """
-    cmd = command.lower().strip()
+    handler = _COMMANDS.get(command.lower().strip())
+    if handler is None:
+        from loguru import logger
 
-    if cmd in ("/quit", "/exit", "/q"):
-        return True
-
-    if cmd == "/new":
-        await browser.new_chat()
-        logger.info("Started new chat")
-        return False
-
-    if cmd == "/screenshot":
-        path = await browser.screenshot()
-        logger.info(f"Screenshot saved: {path}")
+        logger.warning(f"Unknown command: {command}")
         return False
-
-    if cmd == "/status":
-        logged_in = await browser.is_logged_in()
-        status = "Logged in ✓" if logged_in else "Not logged in ✗"
-        print(f"Status: {status}")
-        return False
-
-    if cmd == "/help":
-        print_interactive_help()
-        return False
-
-    logger.warning(f"Unknown command: {command}")
-    return False
+    return await handler(browser)
 
 
 # =============================================================================
@@ -180,13 +257,10 @@ def run_server_mode(host: str, port: int) -> None:
     from wagent.server import run_server
 
     config = Config.load()
+    # ログ・スクリーンショット・ユーザーデータの各ディレクトリは
+    # 実際に書き込む箇所で必要になった時点で作成される
     setup_logging(config.logging.level, config.logging.file)
 
-    # ディレクトリ作成
-    Path("logs").mkdir(exist_ok=True)
-    Path("screenshots").mkdir(exist_ok=True)
-    Path(config.browser.user_data_dir).mkdir(exist_ok=True)
-
     run_server(host=host, port=port)
 
 
@@ -195,13 +269,7 @@ def run_server_mode(host: str, port: int) -> None:
 # =============================================================================
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """引数パーサーを作成"""
-    parser = argparse.ArgumentParser(
-        prog="wagent",
-        description="Wagent - ChatGPT Web UI Bridge",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_EPILOG = """
 Examples:
   # Start API server
   wagent --server
@@ -212,7 +280,19 @@ Examples:
 
   # Show version
   wagent --version
-        """,
+        """
+
+_VERSION_FLAGS = frozenset({"-v", "--version"})
+
+
+@functools.lru_cache(maxsize=1)
+def create_parser() -> argparse.ArgumentParser:
+    """引数パーサーを作成"""
+    parser = argparse.ArgumentParser(
+        prog="wagent",
+        description="Wagent - ChatGPT Web UI Bridge",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
     )
 
     mode_group = parser.add_mutually_exclusive_group(required=True)
@@ -264,6 +344,11 @@ def get_version() -> str:
 
 def main() -> NoReturn | None:
     """メインエントリーポイント"""
+    # バージョン表示のみならパーサーを構築せずに終了
+    if len(sys.argv) == 2 and sys.argv[1] in _VERSION_FLAGS:
+        sys.stdout.write(f"wagent {get_version()}\n")
+        sys.exit(0)
+
     parser = create_parser()
     args = parser.parse_args()
 
@@ -277,12 +362,18 @@ def main() -> NoReturn | None:
         if args.server:
             run_server_mode(args.host, args.port)
         elif args.interactive:
+            import asyncio
+
             asyncio.run(run_interactive_mode())
 
     except KeyboardInterrupt:
+        from loguru import logger
+
         logger.info("Interrupted by user")
         sys.exit(0)
     except Exception as e:
+        from loguru import logger
+
         logger.exception(f"Fatal error: {e}")
         sys.exit(1)
 
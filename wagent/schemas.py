@@ -10,7 +10,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
 
 # =============================================================================
 # 列挙型
@@ -43,6 +43,18 @@ class BrowserStatus(str, Enum):
 class ChatRequest(BaseModel):
     """チャットリクエスト"""
 
+    # 前後の空白除去は pydantic-core 側で行い、除去後に min_length を検証する
+    model_config = ConfigDict(
+        str_strip_whitespace=True,
+        json_schema_extra={
+            "example": {
+                "message": "Pythonでフィボナッチ数列を計算するコードを書いてください",
+                "new_conversation": False,
+                "timeout_ms": 60000,
+            }
+        },
+    )
+
     message: str = Field(
         ...,
         min_length=1,
@@ -60,23 +72,6 @@ class ChatRequest(BaseModel):
         description="レスポンス待機タイムアウト（ミリ秒）",
     )
 
-    @field_validator("message")
-    @classmethod
-    def message_not_empty(cls, v: str) -> str:
-        """メッセージが空でないことを確認"""
-        if not v.strip():
-            raise ValueError("Message cannot be empty or whitespace only")
-        return v.strip()
-
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "message": "Pythonでフィボナッチ数列を計算するコードを書いてください",
-                "new_conversation": False,
-                "timeout_ms": 60000,
-            }
-        }
-
 
 # =============================================================================
 # レスポンススキーマ
@@ -86,6 +81,9 @@ class ChatRequest(BaseModel):
 class BaseResponse(BaseModel):
     """レスポンスの基底クラス"""
 
+    # レスポンスは生成後に変更しない
+    model_config = ConfigDict(frozen=True)
+
     success: bool = Field(..., description="リクエストの成功/失敗")
     timestamp: datetime = Field(
         default_factory=datetime.now,
@@ -96,6 +94,20 @@ class BaseResponse(BaseModel):
 class ChatResponse(BaseResponse):
     """チャットレスポンス"""
 
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "success": True,
+                "message": "以下はPythonでフィボナッチ数列を計算するコードです...",
+                "status": "success",
+                "elapsed_seconds": 5.23,
+                "prompt_length": 45,
+                "response_length": 350,
+                "timestamp": "2024-12-24T12:00:00",
+            }
+        },
+    )
+
     message: Optional[str] = Field(
         None,
         description="ChatGPTからのレスポンス",
@@ -120,19 +132,10 @@ class ChatResponse(BaseResponse):
         None,
         description="レスポンスの長さ",
     )
-
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "success": True,
-                "message": "以下はPythonでフィボナッチ数列を計算するコードです...",
-                "status": "success",
-                "elapsed_seconds": 5.23,
-                "prompt_length": 45,
-                "response_length": 350,
-                "timestamp": "2024-12-24T12:00:00",
-            }
-        }
+    retry_after: Optional[float] = Field(
+        None,
+        description="次のリクエストが受け付けられるまでの秒数",
+    )
 
 
 class StatusResponse(BaseResponse):
@@ -165,6 +168,8 @@ class SessionResponse(BaseResponse):
 class HealthResponse(BaseModel):
     """ヘルスチェックレスポンス"""
 
+    model_config = ConfigDict(frozen=True)
+
     status: str = Field(default="healthy")
     version: str = Field(...)
     timestamp: datetime = Field(default_factory=datetime.now)
@@ -6,13 +6,17 @@ Server - FastAPIベースのRESTサーバー
 
 from __future__ import annotations
 
+import asyncio
+import math
+import sys
 import time
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, NoReturn, Optional
 
-from fastapi import FastAPI, HTTPException, Request
+import orjson
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from loguru import logger
@@ -36,16 +40,36 @@ from wagent.schemas import (
 # =============================================================================
 
 
+_NS_PER_SECOND = 1_000_000_000
+_WINDOW_NS = 60 * _NS_PER_SECOND
+
+
 @dataclass
 class RateLimiter:
-    """トークンバケット方式のレートリミッター"""
+    """トークンバケット方式のレートリミッター
+
+    時刻は ``time.monotonic_ns()`` の整数ナノ秒で扱う（壁時計の補正の影響を受けない）。
+    """
 
     requests_per_minute: int = 10
     min_interval: float = 3.0
     burst_limit: int = 3
-    _last_request_time: float = field(default=0.0, init=False)
+    _min_interval_ns: int = field(default=0, init=False)
+    _rpm_cap: int = field(default=0, init=False)
+    _last_request_ns: int = field(default=0, init=False)
     _request_count: int = field(default=0, init=False)
-    _window_start: float = field(default=0.0, init=False)
+    _window_start_ns: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        self._min_interval_ns = int(self.min_interval * _NS_PER_SECOND)
+        # requests_per_minute <= 0 は回数制限なし（最小間隔のみ適用）
+        self._rpm_cap = (
+            self.requests_per_minute if self.requests_per_minute > 0 else sys.maxsize
+        )
+        # 起動直後の最初のリクエストが最小間隔に掛からないようにする
+        now = time.monotonic_ns()
+        self._last_request_ns = now - self._min_interval_ns
+        self._window_start_ns = now - _WINDOW_NS
 
     def check(self) -> tuple[bool, Optional[str]]:
         """
@@ -54,29 +78,56 @@ class RateLimiter:
         Returns:
             (許可されるか, エラーメッセージ)
         """
-        now = time.time()
+        now = time.monotonic_ns()
 
-        # 最小間隔チェック
-        time_since_last = now - self._last_request_time
-        if time_since_last < self.min_interval:
-            wait_time = self.min_interval - time_since_last
+        # ウィンドウリセット
+        if now - self._window_start_ns > _WINDOW_NS:
+            self._window_start_ns = now
+            self._request_count = 0
+
+        # 許可されるケースを1回の判定で通す
+        since_last = now - self._last_request_ns
+        if since_last >= self._min_interval_ns and self._request_count < self._rpm_cap:
+            return True, None
+
+        # 以下は拒否時のみ（理由の判定）
+        if since_last < self._min_interval_ns:
+            wait_time = (self._min_interval_ns - since_last) / _NS_PER_SECOND
             return False, f"Please wait {wait_time:.1f} seconds"
 
-        # ウィンドウリセット
-        if now - self._window_start > 60:
-            self._window_start = now
+        return False, "Rate limit exceeded (requests per minute)"
+
+    def rpm_exhausted(self) -> bool:
+        """1分あたりの上限に達しているか（期限切れのウィンドウはリセット）"""
+        now = time.monotonic_ns()
+        if now - self._window_start_ns > _WINDOW_NS:
+            self._window_start_ns = now
             self._request_count = 0
+        return self._request_count >= self._rpm_cap
 
-        # RPMチェック
-        if self._request_count >= self.requests_per_minute:
-            return False, "Rate limit exceeded (requests per minute)"
+    def interval_remaining(self) -> float:
+        """最小間隔を満たすまでの残り秒数（満たしていれば0）"""
+        since_last = time.monotonic_ns() - self._last_request_ns
+        return max(self._min_interval_ns - since_last, 0) / _NS_PER_SECOND
 
-        return True, None
+    def retry_after(self, now: Optional[int] = None) -> float:
+        """次のリクエストが許可されるまでの秒数"""
+        if now is None:
+            now = time.monotonic_ns()
+        wait = self._min_interval_ns - (now - self._last_request_ns)
 
-    def record(self) -> None:
-        """リクエストを記録"""
-        self._last_request_time = time.time()
+        in_window = now - self._window_start_ns
+        if self._request_count >= self._rpm_cap and in_window <= _WINDOW_NS:
+            wait = max(wait, _WINDOW_NS - in_window)
+
+        return max(wait, 0) / _NS_PER_SECOND
+
+    def record(self) -> int:
+        """リクエストを記録し、記録時刻（ナノ秒）を返す"""
+        now = time.monotonic_ns()
+        self._last_request_ns = now
         self._request_count += 1
+        return now
 
 
 # =============================================================================
@@ -92,7 +143,14 @@ class AppState:
     selectors: Optional[Selectors] = None
     browser: Optional[BrowserController] = None
     rate_limiter: Optional[RateLimiter] = None
+    # 起動後は変化しない設定値（ステータス応答用にキャッシュ）
+    headless: bool = False
     start_time: float = field(default_factory=time.time)
+    # 起動処理の完了通知（成否は startup_error で判定）
+    ready: asyncio.Event = field(default_factory=asyncio.Event)
+    startup_error: Optional[str] = None
+    # ブラウザ（単一ページ）の同時操作を防ぐ
+    browser_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
 
     @property
     def uptime_seconds(self) -> float:
@@ -109,6 +167,30 @@ app_state = AppState()
 # =============================================================================
 
 
+async def _start_browser(config: Config, selectors: Selectors) -> None:
+    """ブラウザを起動してChatGPTを開き、準備完了を通知"""
+    browser: Optional[BrowserController] = None
+    try:
+        browser = await BrowserController.start(config, selectors)
+        await browser.navigate_to_chatgpt()
+    except asyncio.CancelledError:
+        if browser is not None:
+            await browser.close()
+        raise
+    except Exception as e:
+        logger.exception("Failed to start browser")
+        if browser is not None:
+            await browser.close()
+        # /ready の待機者にすぐ失敗を返せるよう、エラーを記録して完了を通知
+        app_state.startup_error = f"Browser startup failed: {e}"
+        app_state.ready.set()
+        return
+
+    app_state.browser = browser
+    app_state.ready.set()
+    logger.info(f"Wagent server ready (headless={config.browser.headless})")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """アプリケーションのライフサイクル管理"""
@@ -118,27 +200,48 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     config = Config.load()
     selectors = Selectors.load()
 
-    # レートリミッター初期化
-    rate_limiter = RateLimiter(
-        requests_per_minute=config.rate_limit.requests_per_minute,
-        min_interval=config.rate_limit.min_interval,
-        burst_limit=config.rate_limit.burst_limit,
-    )
+    # レートリミッター初期化（無効時、または回数・間隔とも無制限の場合は
+    # None にしてチェック自体を省く）
+    limits = config.rate_limit
+    rate_limiter: Optional[RateLimiter] = None
+    if limits.enabled and (limits.requests_per_minute > 0 or limits.min_interval > 0):
+        rate_limiter = RateLimiter(
+            requests_per_minute=limits.requests_per_minute,
+            min_interval=limits.min_interval,
+            burst_limit=limits.burst_limit,
+        )
+    else:
+        logger.info("Rate limiting disabled")
 
     app_state.config = config
     app_state.selectors = selectors
     app_state.rate_limiter = rate_limiter
+    app_state.headless = config.browser.headless
     app_state.start_time = time.time()
-
-    # ブラウザコントローラーを開始
-    async with BrowserController.create(config, selectors) as browser:
-        app_state.browser = browser
-
-        # ChatGPTに移動
-        await browser.navigate_to_chatgpt()
-
-        logger.info(f"Wagent server ready (headless={config.browser.headless})")
+    # Event / Lock は生成後に最初に使ったイベントループに束縛されるため、
+    # アプリ（ライフスパン）ごとに作り直す
+    app_state.ready = asyncio.Event()
+    app_state.browser_lock = asyncio.Lock()
+    app_state.startup_error = None
+
+    # OpenAPIスキーマを起動時に生成（app.openapi_schema にキャッシュされる）
+    app.openapi()
+
+    # ブラウザはバックグラウンドで起動し、その間もサーバーは接続を受け付ける
+    # （/ready は起動完了までロングポーリングで待機できる）
+    startup = asyncio.create_task(_start_browser(config, selectors))
+    try:
         yield
+    finally:
+        app_state.ready.clear()
+        if not startup.done():
+            startup.cancel()
+        with suppress(asyncio.CancelledError, Exception):
+            await startup
+
+        browser, app_state.browser = app_state.browser, None
+        if browser is not None:
+            await browser.close()
 
     logger.info("Wagent server shutdown complete")
 
@@ -148,52 +251,70 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 # =============================================================================
 
 
-app = FastAPI(
-    title="Wagent API",
-    description="Web版ChatGPTをAPIとして利用するためのブリッジサーバー",
-    version=__version__,
-    lifespan=lifespan,
-    docs_url="/docs",
-    redoc_url="/redoc",
-)
+class _ORJSONResponse(JSONResponse):
+    """orjson でエンコードする JSONResponse
+
+    response_model を持つエンドポイントは FastAPI 側で直接シリアライズされるため、
+    それを経由しない dict を返す経路（例外ハンドラー等）で使う。
+    datetime は orjson がそのまま ISO 8601 に変換する。
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+router = APIRouter()
+
+# 500 エラー本文の雛形（ErrorResponse と同じ形。毎回のモデル生成を省く）
+_ERROR_TEMPLATE: dict[str, object] = {
+    "success": False,
+    "timestamp": None,
+    "error": "Internal server error",
+    "detail": None,
+    "error_code": None,
+}
 
 
 # エラーハンドラー
-@app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """グローバル例外ハンドラー"""
-    logger.error(f"Unhandled exception: {exc}")
-    return JSONResponse(
+    detail = str(exc)
+    logger.opt(exception=exc).error("Unhandled exception: {}", detail)
+    return _ORJSONResponse(
         status_code=500,
-        content=ErrorResponse(
-            success=False,
-            error="Internal server error",
-            detail=str(exc),
-        ).model_dump(),
+        content={
+            **_ERROR_TEMPLATE,
+            "detail": detail,
+            "timestamp": datetime.now(),
+        },
     )
 
 
-# CORS設定（起動時に設定）
-@app.on_event("startup")
-async def setup_cors() -> None:
-    """CORS設定を適用"""
-    if app_state.config and app_state.config.server.cors.enabled:
-        app.add_middleware(
-            CORSMiddleware,
-            allow_origins=list(app_state.config.server.cors.origins),
-            allow_credentials=True,
-            allow_methods=["*"],
-            allow_headers=["*"],
-        )
-
-
 # =============================================================================
 # エンドポイント
 # =============================================================================
 
 
-@app.post("/v1/chat", response_model=ChatResponse)
-async def send_chat(request: ChatRequest) -> ChatResponse:
+async def get_browser() -> BrowserController:
+    """
+    初期化済みのブラウザコントローラーを返す依存関数
+
+    同期関数だとスレッドプールで実行されるため async で定義する。
+    """
+    browser = app_state.browser
+    if browser is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Browser not initialized",
+        )
+    return browser
+
+
+@router.post("/v1/chat", response_model=ChatResponse)
+async def send_chat(
+    request: ChatRequest,
+    browser: BrowserController = Depends(get_browser),
+) -> ChatResponse:
     """
     メッセージを送信し、ChatGPTからの回答を返す
 
@@ -201,42 +322,76 @@ async def send_chat(request: ChatRequest) -> ChatResponse:
     - **new_conversation**: 新しい会話を開始するかどうか
     - **timeout_ms**: レスポンス待機タイムアウト（ミリ秒）
     """
-    # レートリミットチェック
-    if app_state.rate_limiter:
-        allowed, error_msg = app_state.rate_limiter.check()
-        if not allowed:
-            raise HTTPException(
-                status_code=429,
-                detail=error_msg or "Rate limit exceeded",
-            )
-
-    if app_state.browser is None:
-        raise HTTPException(
-            status_code=503,
-            detail="Browser not initialized",
+    limiter = app_state.rate_limiter
+    if limiter and limiter.rpm_exhausted():
+        # 回数上限は待っても当面解消しないため、ロック待ちに入る前に拒否
+        _reject_rate_limited(
+            "Rate limit exceeded (requests per minute)", limiter.retry_after()
         )
 
-    start_time = time.time()
+    async with app_state.browser_lock:
+        if limiter:
+            # ブラウザ操作はもともと直列のため、最小間隔は拒否せずに待って満たす
+            while (delay := limiter.interval_remaining()) > 0:
+                await asyncio.sleep(delay)
+            _enforce_rate_limit(limiter)
+
+        return await _run_chat(browser, request)
+
+
+def _enforce_rate_limit(limiter: RateLimiter) -> None:
+    """レートリミットを超えていれば 429 を送出"""
+    allowed, error_msg = limiter.check()
+    if not allowed:
+        _reject_rate_limited(error_msg or "Rate limit exceeded", limiter.retry_after())
+
+
+def _reject_rate_limited(detail: str, retry_after: float) -> NoReturn:
+    """Retry-After 付きの 429 を送出"""
+    raise HTTPException(
+        status_code=429,
+        detail=detail,
+        headers={"Retry-After": str(math.ceil(retry_after))},
+    )
+
+
+# エラー応答の雛形（model_copy で可変部分だけ差し替え、検証を省く）
+_TIMEOUT_RESPONSE = ChatResponse.model_construct(
+    success=False,
+    error="Response timeout exceeded",
+    status=ResponseStatus.TIMEOUT,
+    elapsed_seconds=0.0,
+)
+_ERROR_RESPONSE = ChatResponse.model_construct(
+    success=False,
+    status=ResponseStatus.ERROR,
+    elapsed_seconds=0.0,
+)
+
+
+async def _run_chat(browser: BrowserController, request: ChatRequest) -> ChatResponse:
+    """プロンプトを送信してレスポンスを取得（browser_lock 取得済みで呼ぶ）"""
+    start_time = time.perf_counter()
     prompt_length = len(request.message)
 
     try:
         # 新しい会話を開始
         if request.new_conversation:
-            await app_state.browser.new_chat()
+            await browser.new_chat()
 
         # プロンプト送信
-        await app_state.browser.send_prompt(request.message)
+        await browser.send_prompt(request.message)
 
         # レスポンス取得
-        response_text = await app_state.browser.wait_for_response(
-            timeout_ms=request.timeout_ms
-        )
+        response_text = await browser.wait_for_response(timeout_ms=request.timeout_ms)
 
         # レートリミッター記録
+        retry_after = None
         if app_state.rate_limiter:
-            app_state.rate_limiter.record()
+            recorded_at = app_state.rate_limiter.record()
+            retry_after = app_state.rate_limiter.retry_after(recorded_at)
 
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
 
         return ChatResponse(
             success=True,
@@ -245,32 +400,34 @@ async def send_chat(request: ChatRequest) -> ChatResponse:
             elapsed_seconds=elapsed,
             prompt_length=prompt_length,
             response_length=len(response_text),
+            retry_after=retry_after,
         )
 
     except TimeoutError:
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         logger.error("Response timeout")
-        return ChatResponse(
-            success=False,
-            error="Response timeout exceeded",
-            status=ResponseStatus.TIMEOUT,
-            elapsed_seconds=elapsed,
-            prompt_length=prompt_length,
+        return _TIMEOUT_RESPONSE.model_copy(
+            update={
+                "elapsed_seconds": elapsed,
+                "prompt_length": prompt_length,
+                "timestamp": datetime.now(),
+            }
         )
 
     except Exception as e:
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         logger.error(f"Chat error: {e}")
-        return ChatResponse(
-            success=False,
-            error=str(e),
-            status=ResponseStatus.ERROR,
-            elapsed_seconds=elapsed,
-            prompt_length=prompt_length,
+        return _ERROR_RESPONSE.model_copy(
+            update={
+                "error": str(e),
+                "elapsed_seconds": elapsed,
+                "prompt_length": prompt_length,
+                "timestamp": datetime.now(),
+            }
         )
 
 
-@app.get("/v1/status", response_model=StatusResponse)
+@router.get("/v1/status", response_model=StatusResponse)
 async def get_status() -> StatusResponse:
     """ブラウザの生存確認とログイン状態をチェック"""
     if app_state.browser is None:
@@ -284,13 +441,12 @@ async def get_status() -> StatusResponse:
 
     try:
         logged_in = await app_state.browser.is_logged_in()
-        headless = app_state.config.browser.headless if app_state.config else False
 
         return StatusResponse(
             success=True,
             browser_status=BrowserStatus.READY,
             logged_in=logged_in,
-            headless=headless,
+            headless=app_state.headless,
             uptime_seconds=app_state.uptime_seconds,
         )
 
@@ -305,7 +461,7 @@ async def get_status() -> StatusResponse:
         )
 
 
-@app.delete("/v1/session", response_model=SessionResponse)
+@router.delete("/v1/session", response_model=SessionResponse)
 async def reset_session() -> SessionResponse:
     """新しいチャットを開始してコンテキストをリセット"""
     if app_state.browser is None:
@@ -315,7 +471,8 @@ async def reset_session() -> SessionResponse:
         )
 
     try:
-        await app_state.browser.new_chat()
+        async with app_state.browser_lock:
+            await app_state.browser.new_chat()
         return SessionResponse(
             success=True,
             message="Session reset. New chat started.",
@@ -329,7 +486,7 @@ async def reset_session() -> SessionResponse:
         )
 
 
-@app.get("/v1/screenshot")
+@router.get("/v1/screenshot", response_class=_ORJSONResponse)
 async def take_screenshot() -> dict:
     """デバッグ用：現在のブラウザ画面のスクリーンショットを取得"""
     if app_state.browser is None:
@@ -344,14 +501,90 @@ async def take_screenshot() -> dict:
         return {"success": False, "error": str(e)}
 
 
-@app.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
-    """ヘルスチェック"""
-    return HealthResponse(
-        status="healthy",
+@router.get("/ready", response_model=StatusResponse)
+async def wait_ready(
+    timeout: float = Query(30.0, ge=0, le=300, description="最大待機時間（秒）"),
+) -> StatusResponse:
+    """
+    ブラウザの初期化完了まで待機し、ステータスを返す（ロングポーリング）
+
+    起動に失敗した場合は待機せずに 503 を返す。
+    """
+    try:
+        await asyncio.wait_for(app_state.ready.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=504,
+            detail="Server not ready",
+        ) from None
+
+    if app_state.startup_error is not None:
+        raise HTTPException(status_code=503, detail=app_state.startup_error)
+
+    return await get_status()
+
+
+# ヘルスチェック本文の固定部分（HealthResponse と同じ形）
+_HEALTH_BODY: dict[str, object] = {"status": "healthy", "version": __version__}
+
+
+@router.head("/health", include_in_schema=False)
+@router.get(
+    "/health",
+    response_class=_ORJSONResponse,
+    responses={200: {"model": HealthResponse}},
+)
+async def health_check() -> _ORJSONResponse:
+    """ヘルスチェック（頻繁にポーリングされるためモデル生成を省く）"""
+    return _ORJSONResponse({**_HEALTH_BODY, "timestamp": datetime.now()})
+
+
+def create_app(config: Optional[Config] = None) -> FastAPI:
+    """
+    FastAPIアプリケーションを生成
+
+    ミドルウェアはリクエスト処理開始前に登録する必要があるため、
+    CORS設定はここで同期的に適用する。
+    """
+    if config is None:
+        config = Config.load()
+
+    app = FastAPI(
+        title="Wagent API",
+        description="Web版ChatGPTをAPIとして利用するためのブリッジサーバー",
         version=__version__,
-        timestamp=datetime.now(),
+        lifespan=lifespan,
+        docs_url="/docs",
+        redoc_url="/redoc",
+        responses={500: {"model": ErrorResponse}},
     )
+    app.add_exception_handler(Exception, global_exception_handler)
+
+    if config.server.cors.enabled:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=list(config.server.cors.origins),
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
+
+    app.include_router(router)
+    return app
+
+
+def __getattr__(name: str) -> Any:
+    """
+    旧来の ``wagent.server:app`` 参照向けに、初回アクセス時にアプリを生成
+
+    ``uvicorn wagent.server:app`` や ``from wagent.server import app`` を
+    引き続き利用できるようにする（import 時には設定を読み込まない）。
+    """
+    if name == "app":
+        app = create_app()
+        globals()["app"] = app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # =============================================================================
@@ -369,7 +602,8 @@ def run_server(
 
     logger.info(f"Starting Wagent server on {host}:{port}")
     uvicorn.run(
-        "wagent.server:app",
+        "wagent.server:create_app",
+        factory=True,
         host=host,
         port=port,
         reload=reload,